@@ -39,6 +39,9 @@ class AiEngine(Engine):
         else:
             return super().process(state, element)
 
+        # agents read the map and player statistics, which side effects
+        # only flag as out of date
+        state.refresh_player_statistics()
         start = time()
         if isinstance(element, MovementPhase):
             ret = agent.decide_movement(state, goal=None)
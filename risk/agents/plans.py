@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from typing import List, Protocol
-from risk.state.event_stack.events.turns import MovementOfTroopsEvent
+from risk.state.event_stack import MovementOfTroopsEvent
 from risk.state.game_state import GameState
 from risk.state.plan import Step, Plan, Goal
 from risk.state.event_stack import TroopPlacementEvent, AttackOnTerritoryEvent
@@ -14,7 +14,7 @@ from risk.utils import map
 from ..agent import BaseAgent
 from risk.state.plan import Goal
 from risk.state.event_stack import (
-    TroopPlacementEvent,
+    TroopPlacementBatch,
     AttackOnTerritoryEvent,
     MovementOfTroopsEvent,
     Event,
@@ -47,20 +47,13 @@ class DefensiveAgent(BaseAgent):
             reverse=True,
         )[: int(n_most)]
 
-        events = []
+        batch = TroopPlacementBatch(game_state.total_turns, self.player_id)
         for i in range(game_state.placements_left):
             if top_most:
                 map_node = top_most[int(i % len(top_most))]
-                selected_territory = game_state.get_territory(map_node.id)
-                event = TroopPlacementEvent(
-                    turn=game_state.total_turns,
-                    player=self.player_id,
-                    territory=selected_territory.id,
-                    num_troops=1,
-                )
-                events.append(event)
+                batch.append(map_node.id)
 
-        return events
+        return batch.events()
 
     def decide_attack(self, game_state: GameState, goal: Goal) -> List[Event]:
         info(f"{self.name} deciding attacks...")
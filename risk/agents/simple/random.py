@@ -15,7 +15,7 @@ from risk.utils.logging import info
 from ..agent import BaseAgent
 from risk.state.plan import Goal
 from risk.state.event_stack import (
-    TroopPlacementEvent,
+    TroopPlacementBatch,
     AttackOnTerritoryEvent,
     MovementOfTroopsEvent,
     Event,
@@ -43,19 +43,13 @@ class RandomAgent(BaseAgent):
         placements = game_state.placements_left
 
         # Place one army at a time randomly
-        events = []
+        batch = TroopPlacementBatch(game_state.current_turn, self.player_id)
         for _ in range(placements):
             if owned_territories:
                 selected_territory = random.choice(owned_territories)
-                event = TroopPlacementEvent(
-                    turn=game_state.current_turn,
-                    player=self.player_id,
-                    territory=selected_territory.id,
-                    num_troops=1,
-                )
-                events.append(event)
+                batch.append(selected_territory.id)
 
-        return events
+        return batch.events()
 
     def decide_attack(self, game_state: GameState, goal: Goal) -> List[Event]:
         info(f"{self.name} planning for attack...")
@@ -93,8 +93,7 @@ class SimulationController:
                             )
                         )
                         continue
-                    for event in events:
-                        self.event_stack.push(event)
+                    self.event_stack.extend(events)
 
         return True
 
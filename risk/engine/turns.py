@@ -7,7 +7,7 @@ from .base import Engine, Event, Level
 from ..state import GameState
 from typing import List, Union
 
-from ..state.event_stack import PlayingEvent, AgentTurnPhase, GameEvent
+from ..state.event_stack import PlayingEvent, AgentTurnPhase, GameEvent, phase_event
 
 
 class RiskGameEngine(Engine):
@@ -39,7 +39,11 @@ class RiskGameEngine(Engine):
             if winner is None:
                 ret.append(PlayingEvent())
                 ret.append(
-                    AgentTurnPhase(game_state.total_turns, game_state.current_player_id)
+                    phase_event(
+                        AgentTurnPhase,
+                        game_state.total_turns,
+                        game_state.current_player_id,
+                    )
                 )
         return ret
 
@@ -95,34 +99,30 @@ class RiskTurnEngine(Engine):
         super().__init__("RiskTurnEngine")
 
     def process(self, game_state: GameState, element: Union[Event, Level]) -> None:
+        turn = game_state.total_turns
+        player = game_state.current_player_id
         if isinstance(element, AgentTurnPhase):
             phases = [
-                MovementPhase(game_state.total_turns, game_state.current_player_id),
+                phase_event(MovementPhase, turn, player),
                 UpdateState(),
-                AttackPhase(game_state.total_turns, game_state.current_player_id),
+                phase_event(AttackPhase, turn, player),
                 UpdateState(),
-                PlacementPhase(game_state.total_turns, game_state.current_player_id),
-                UpdateReinforcements(game_state.current_player_id),
+                phase_event(PlacementPhase, turn, player),
+                UpdateReinforcements(player),
             ]
             return phases
         if isinstance(element, PlacementPhase):
             return [
-                PlacementPhaseEndEvent(
-                    game_state.total_turns, game_state.current_player_id
-                ),
+                phase_event(PlacementPhaseEndEvent, turn, player),
             ]
         elif isinstance(element, AttackPhase):
             return [
-                AttackPhaseEndEvent(
-                    game_state.total_turns, game_state.current_player_id
-                )
+                phase_event(AttackPhaseEndEvent, turn, player)
             ]
         elif isinstance(element, MovementPhase):
             return [
-                AgentTurnEndEvent(game_state.total_turns, game_state.current_player_id),
-                MovementPhaseEndEvent(
-                    game_state.total_turns, game_state.current_player_id
-                ),
+                phase_event(AgentTurnEndEvent, turn, player),
+                phase_event(MovementPhaseEndEvent, turn, player),
             ]
         elif isinstance(element, AgentTurnEndEvent):
             return [
@@ -133,7 +133,7 @@ class RiskTurnEngine(Engine):
         return super().process(game_state, element)
 
 
-from ..state.event_stack.events.turns import TroopPlacementEvent
+from ..state.event_stack import TroopPlacementEvent
 
 from ..state.event_stack import AdjustArmies, RejectTroopPlacement
 
@@ -289,7 +289,7 @@ class RiskAttackEngine(Engine):
                 )
             ]
 
-        if defender not in attacker.adjacent_territories:
+        if not attacker.is_adjacent_to(defender.id):
             return [
                 RejectAttack(
                     game_state.total_turns,
@@ -345,9 +345,11 @@ class RiskAttackEngine(Engine):
             defender_territory_id=element.context.defending_territory_id,
             initial_attackers=element.context.attacking_armies,
             initial_defenders=element.context.defending_armies,
+            record_history=False,
+            rng=game_state.get_rng(),
         )
 
-        result = fight.fight_to_completion()
+        result = fight.fight_to_completion_fast()
         atk_sur, def_sur = fight.get_surviving_armies()
 
         return [
@@ -372,7 +374,7 @@ class RiskAttackEngine(Engine):
         def_id = fight.defender_territory_id
         atk_cas = fight.total_attacker_casualties
         def_cas = fight.total_defender_casualties
-        atk_sur, _ = fight.get_surviving_armies()
+        atk_sur, def_sur = fight.get_surviving_armies()
         result: FightResult = element.context.fight_result
 
         ret = []
@@ -385,11 +387,14 @@ class RiskAttackEngine(Engine):
                     num_armies=atk_sur,
                 )
             )
+            # the defender's armies from before the fight, as none survive
+            # a capture and reverting it should bring them back
             ret.append(
                 CaptureTerritory(
                     def_id,
                     element.context.player_id,
                     game_state.get_territory(def_id).owner,
+                    def_sur + def_cas,
                 )
             )
 
@@ -470,7 +475,7 @@ class RiskMovementEngine(Engine):
                 )
             ]
 
-        if to_territory not in from_territory.adjacent_territories:
+        if not from_territory.is_adjacent_to(to_territory.id):
             return [
                 RejectTransfer(
                     game_state.total_turns,
@@ -1,6 +1,6 @@
 from typing import List, Union, Optional
 
-from risk.state.event_stack.events.turns import AttackPhaseEndEvent
+from risk.state.event_stack import AttackPhaseEndEvent
 
 from ...engine import Engine
 from ...state.game_state import GameState
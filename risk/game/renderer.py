@@ -436,6 +436,7 @@ class GameRenderer:
         self.screen.blit(turn_text, (summary_x, start_y - turn_text.get_height() // 2))
         start_y += 50
 
+        self.game_state.refresh_player_statistics()
         for i, player in enumerate(self.game_state.players.values()):
             # Calculate box position
             box_x = summary_x
@@ -399,7 +399,7 @@ class TerritorySelectionHandler:
         else:
             if territory.owner == current_turn.player_id:
                 print("Invalid attack target - cannot attack own territory")
-            elif territory.id not in primary_territory.adjacent_territories:
+            elif not primary_territory.is_adjacent_to(territory.id):
                 print("Invalid attack target - territories are not adjacent")
                 print(
                     f"DEBUG: Available adjacent targets: {[self.game_state.territories[tid].name for tid in primary_territory.adjacent_territories if tid in self.game_state.territories]}"
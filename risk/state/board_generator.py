@@ -92,11 +92,15 @@ class PolygonTerritory:
         """
         return self.signed_area() < 0
 
-    def divide(self) -> Tuple["PolygonTerritory", "PolygonTerritory"]:
+    def divide(
+        self, rng: random.Random = random
+    ) -> Tuple["PolygonTerritory", "PolygonTerritory"]:
         """
         Divide this polygon into two smaller polygons using a random walk
         line. Uses random vertex selection and jagged division lines.
 
+        :param rng: Random number generator to draw the division from
+
         :returns: Two new PolygonTerritory instances resulting from the
                  division
         :raises ValueError: When polygon cannot be divided after multiple
@@ -107,15 +111,17 @@ class PolygonTerritory:
         lprop = None
         attempts = 0
         while (left is None or right is None) or (lprop < 0.3 or lprop > 0.7):
-            choice = random.choice(range(len(self.vertices)))
-            other = random.choice(range(len(self.vertices)))
+            choice = rng.choice(range(len(self.vertices)))
+            other = rng.choice(range(len(self.vertices)))
             while choice == other and abs(choice - other) < 25:
-                other = random.choice(range(len(self.vertices)))
+                other = rng.choice(range(len(self.vertices)))
 
             lpivot = self.vertices[choice]
             rpivot = self.vertices[other]
 
-            walk = random_walk(lpivot, rpivot, num_steps=25, variation_strength=0.02)
+            walk = random_walk(
+                lpivot, rpivot, num_steps=25, variation_strength=0.02, rng=rng
+            )
 
             if choice < other:
                 left = PolygonTerritory(self.vertices[choice + 1 : other] + walk[::-1])
@@ -426,13 +432,17 @@ class PolygonTerritory:
 
 
 def create_polygon_to_fill_space(
-    dimensions: Tuple[int, int], portion: float = 0.75, attempt: int = 0
+    dimensions: Tuple[int, int],
+    portion: float = 0.75,
+    attempt: int = 0,
+    rng: random.Random = random,
 ) -> PolygonTerritory:
     """Create a realistic polygon using random walk between eclipse control points.
 
     Args:
         dimensions: (width, height) of the available space
         portion: Portion of the total area the polygon should occupy (0.0 to 1.0)
+        rng: Random number generator to draw the shape from
 
     Returns:
         PolygonTerritory with jagged eclipse-like shape
@@ -448,7 +458,7 @@ def create_polygon_to_fill_space(
     # Create eclipse parameters to achieve target area
     # Area of eclipse = π * a * b, where a and b are semi-axes
     # We'll use a ratio to make it look natural (not perfectly circular)
-    aspect_ratio = random.uniform(0.6, 1.4)  # Eclipse aspect ratio
+    aspect_ratio = rng.uniform(0.6, 1.4)  # Eclipse aspect ratio
 
     # Solve for semi-axes: target_area = π * a * b, and b = a * aspect_ratio
     # So: target_area = π * a² * aspect_ratio
@@ -483,7 +493,7 @@ def create_polygon_to_fill_space(
         angle = (2 * math.pi * i) / num_control_points
 
         # Add some angular variation for more natural shape
-        angle_variation = random.uniform(-0.2, 0.2)
+        angle_variation = rng.uniform(-0.2, 0.2)
         varied_angle = angle + angle_variation
 
         # Calculate base eclipse point
@@ -491,7 +501,7 @@ def create_polygon_to_fill_space(
         base_y = center_y + semi_axis_b * math.sin(varied_angle)
 
         # Add radial variation to make it more jagged
-        radial_variation = random.uniform(0.7, 1.3)
+        radial_variation = rng.uniform(0.7, 1.3)
 
         # Apply variation
         final_x = center_x + (base_x - center_x) * radial_variation
@@ -515,7 +525,8 @@ def create_polygon_to_fill_space(
             Point(*start_point),
             Point(*end_point),
             num_steps=10,
-            variation_strength=random.uniform(0.01, 0.15),
+            variation_strength=rng.uniform(0.01, 0.15),
+            rng=rng,
         )
 
         # Add walk points (excluding the last point to avoid duplication)
@@ -536,7 +547,7 @@ def create_polygon_to_fill_space(
             f"Polygon validation failed on attempt {attempt}: {validation['errors']}",
             RuntimeWarning,
         )
-        return create_polygon_to_fill_space(dimensions, portion, attempt + 1)
+        return create_polygon_to_fill_space(dimensions, portion, attempt + 1, rng)
 
     return polygon
 
@@ -544,15 +555,19 @@ def create_polygon_to_fill_space(
 class BoardGenerator:
     """Generates dynamic Risk-like boards using polygon subdivision."""
 
-    def __init__(self, width: int = 1000, height: int = 600):
+    def __init__(
+        self, width: int = 1000, height: int = 600, rng: random.Random = random
+    ):
         """Initialize the board generator.
 
         Args:
             width: Board width for territory placement
             height: Board height for territory placement
+            rng: Random number generator to draw the board from
         """
         self.width = width
         self.height = height
+        self.rng = rng
         self.margin = 50  # Margin from edges
 
     def generate_board(self, game_state: GameState) -> None:
@@ -563,7 +578,7 @@ class BoardGenerator:
         """
         # Create the initial large continent polygon
         initial_polygon = create_polygon_to_fill_space(
-            (self.width, self.height), portion=0.90
+            (self.width, self.height), portion=0.90, rng=self.rng
         )
         print(
             f"Created initial continent with {len(initial_polygon.vertices)} vertices, area: {initial_polygon.area():.2f}"
@@ -610,7 +625,7 @@ class BoardGenerator:
             region_to_divide = max(undivided_regions, key=lambda r: r.area())
             undivided_regions.remove(region_to_divide)
             try:
-                divided_regions = region_to_divide.divide()
+                divided_regions = region_to_divide.divide(self.rng)
                 undivided_regions.extend(divided_regions)
             except ValueError:
                 # If division fails, re-add the region and try again
@@ -735,7 +750,7 @@ class BoardGenerator:
         """
         # Shuffle territories for random assignment
         shuffled_territories = territories.copy()
-        random.shuffle(shuffled_territories)
+        self.rng.shuffle(shuffled_territories)
 
         # Assign territories to players in round-robin fashion
         players = list(game_state.players.values())
@@ -766,7 +781,7 @@ class BoardGenerator:
             # Distribute remaining armies randomly among this player's territories
             for _ in range(remaining_armies_for_player):
                 if player_territories:  # Safety check
-                    territory = random.choice(player_territories)
+                    territory = self.rng.choice(player_territories)
                     territory.armies += 1
 
         # Verify army distribution is correct
@@ -793,5 +808,5 @@ def generate_sample_board(
     :param width: Board width in pixels for territory generation
     :param height: Board height in pixels for territory generation
     """
-    generator = BoardGenerator(width, height)
+    generator = BoardGenerator(width, height, game_state.get_rng())
     generator.generate_board(game_state)
@@ -3,7 +3,7 @@ A module for the types of the events possible on the
 event stack of the simulation.
 """
 
-from ...event_stack import Event
+from ._base import Event
 
 class GameEvent(Event):
     """
@@ -14,10 +14,105 @@ class GameEvent(Event):
     def __init__(self):
         super().__init__("Game")
 
-from .turns import *
-from .sideffects import *
-from .rejects import *
-from .fights import *
-from .system import *
-from .players import *
-from .ui import *
\ No newline at end of file
+from .turns import (
+    PlayingEvent,
+    AgentTurnPhase,
+    AgentTurnEndEvent,
+    PlacementPhase,
+    TroopPlacementEvent,
+    TroopPlacementBatch,
+    PlacementPhaseEndEvent,
+    AttackPhase,
+    AttackOnTerritoryEvent,
+    CasualtyEvent,
+    CaptureTerritoryEvent,
+    AttackPhaseEndEvent,
+    MovementPhase,
+    MovementOfTroopsEvent,
+    MovementPhaseEndEvent,
+    phase_event,
+)
+from .sideffects import (
+    SideEffect,
+    SideEffectEvent,
+    UpdateReinforcements,
+    ClearReinforcements,
+    AdjustArmies,
+    TransferArmies,
+    CaptureTerritory,
+    CasualitiesOnTerritory,
+    ClearTerritory,
+    UpdateState,
+    EndTurn,
+    PlayerRuntimeAdjust,
+)
+from .rejects import (
+    Rejected,
+    RejectTroopPlacement,
+    RejectAttack,
+    RejectTransfer,
+)
+from .fights import (
+    FightEvent,
+    ResolveFightEvent,
+)
+from .system import (
+    PauseProcessingEvent,
+    SystemInterruptEvent,
+    SystemResumeEvent,
+    SystemStepEvent,
+)
+from .players import (
+    TerritorySelectedEvent,
+    ChangeSelectedTerritoryEvent,
+    TriggerAttackPopupEvent,
+)
+from .ui import (
+    UIActionEvent,
+)
+
+__all__ = [
+    "GameEvent",
+    "PlayingEvent",
+    "AgentTurnPhase",
+    "AgentTurnEndEvent",
+    "PlacementPhase",
+    "TroopPlacementEvent",
+    "TroopPlacementBatch",
+    "PlacementPhaseEndEvent",
+    "AttackPhase",
+    "AttackOnTerritoryEvent",
+    "CasualtyEvent",
+    "CaptureTerritoryEvent",
+    "AttackPhaseEndEvent",
+    "MovementPhase",
+    "MovementOfTroopsEvent",
+    "MovementPhaseEndEvent",
+    "phase_event",
+    "SideEffect",
+    "SideEffectEvent",
+    "UpdateReinforcements",
+    "ClearReinforcements",
+    "AdjustArmies",
+    "TransferArmies",
+    "CaptureTerritory",
+    "CasualitiesOnTerritory",
+    "ClearTerritory",
+    "UpdateState",
+    "EndTurn",
+    "PlayerRuntimeAdjust",
+    "Rejected",
+    "RejectTroopPlacement",
+    "RejectAttack",
+    "RejectTransfer",
+    "FightEvent",
+    "ResolveFightEvent",
+    "PauseProcessingEvent",
+    "SystemInterruptEvent",
+    "SystemResumeEvent",
+    "SystemStepEvent",
+    "TerritorySelectedEvent",
+    "ChangeSelectedTerritoryEvent",
+    "TriggerAttackPopupEvent",
+    "UIActionEvent",
+]
@@ -0,0 +1,9 @@
+"""
+Shared imports for the event modules, so that each module resolves the
+base event types from one place rather than through the events package.
+"""
+
+from ..stack import Event, Level, context_repr
+from abc import ABC, abstractmethod
+
+__all__ = ["Event", "Level", "context_repr", "ABC", "abstractmethod"]
@@ -2,9 +2,36 @@
 This module contains fight-related events for the event stack.
 """
 
-from ..events import Event
+from typing import NamedTuple
+
+from ._base import Event
 from ...fight import Fight, FightResult
 
+__all__ = [
+    "FightEvent",
+    "ResolveFightEvent",
+]
+
+
+class FightContext(NamedTuple):
+    attacking_territory_id: int
+    defending_territory_id: int
+    attacking_armies: int
+    defending_armies: int
+    player_id: int
+    turn: int
+
+
+class ResolveFightContext(NamedTuple):
+    attacking_territory_id: int
+    defending_territory_id: int
+    surviving_attacking_armies: int
+    surviving_defending_armies: int
+    fight: Fight
+    fight_result: FightResult
+    player_id: int
+    turn: int
+
 class FightEvent(Event):
     """
     An event that triggers the response to resolve a fight
@@ -19,6 +46,11 @@ class FightEvent(Event):
         - context.turn
     """
 
+    _NAME_FMT = (
+        "FightEvent on T{turn}-P{player_id}: "
+        "{attacking_territory_id} vs {defending_territory_id}"
+    )
+
     def __init__(self, 
         attacking_territory_id: int,
         defending_territory_id: int,
@@ -28,14 +60,13 @@ class FightEvent(Event):
         turn: int,         
         ):
         super().__init__(
-            f"FightEvent on T{turn}-P{player_id}: {attacking_territory_id} vs {defending_territory_id}",
-            dict(
-                attacking_territory_id=attacking_territory_id,
-                defending_territory_id=defending_territory_id,
-                attacking_armies=attacking_armies,
-                defending_armies=defending_armies,
-                player_id=player_id,
-                turn=turn
+            context=FightContext(
+                attacking_territory_id,
+                defending_territory_id,
+                attacking_armies,
+                defending_armies,
+                player_id,
+                turn,
             )
         )
     
@@ -56,6 +87,9 @@ class ResolveFightEvent(Event):
         - context.turn
 
     """
+
+    _NAME_FMT = "FightResolved on T{turn}-P{player_id}: {fight_result}"
+
     def __init__(self,
             attacking_territory_id: int,
             defending_territory_id: int,
@@ -67,15 +101,14 @@ class ResolveFightEvent(Event):
             turn: int,
         ):
         super().__init__(
-           f"FightResolved on T{turn}-P{player_id}: {str(fight_result)}",
-            dict(
-            attacking_territory_id=attacking_territory_id,
-            defending_territory_id=defending_territory_id,
-            surviving_attacking_armies=surviving_attacking_armies,
-            surviving_defending_armies=surviving_defending_armies,
-            fight=fight,
-            fight_result=fight_result,
-            player_id=player_id,
-            turn=turn
+            context=ResolveFightContext(
+                attacking_territory_id,
+                defending_territory_id,
+                surviving_attacking_armies,
+                surviving_defending_armies,
+                fight,
+                fight_result,
+                player_id,
+                turn,
             )
         )
\ No newline at end of file
@@ -1,8 +1,32 @@
 
-from ..events import Event 
-from ...game_state import GameState
+from typing import NamedTuple, TYPE_CHECKING
+
+from ._base import Event
 from .sideffects import SideEffectEvent
 
+if TYPE_CHECKING:
+    from ...game_state import GameState
+
+__all__ = [
+    "TerritorySelectedEvent",
+    "ChangeSelectedTerritoryEvent",
+    "TriggerAttackPopupEvent",
+]
+
+
+class TerritorySelectedContext(NamedTuple):
+    territory_id: int
+
+
+class ChangeSelectedTerritoryContext(NamedTuple):
+    previous_territory_id: int
+    new_territory_id: int
+
+
+class TriggerAttackPopupContext(NamedTuple):
+    attacker_id: int
+    defender_id: int
+
 class TerritorySelectedEvent(Event):
     """
     Event triggered when a player selects a territory.
@@ -11,9 +35,7 @@ class TerritorySelectedEvent(Event):
     def __init__(self, territory_id: int):
         super().__init__(
             "Territory Selected Event",
-            dict(
-                territory_id=territory_id
-            )
+            TerritorySelectedContext(territory_id)
         )
 
 class ChangeSelectedTerritoryEvent(SideEffectEvent):
@@ -24,16 +46,13 @@ class ChangeSelectedTerritoryEvent(SideEffectEvent):
     def __init__(self, territory_id: int, previous_territory_id: int):
         super().__init__(
             "Changing selected territory",
-            dict(
-                previous_territory_id=previous_territory_id,
-                new_territory_id=territory_id
-            )
+            ChangeSelectedTerritoryContext(previous_territory_id, territory_id)
         )
 
-    def apply(self, state: GameState) -> None:
+    def apply(self, state: "GameState") -> None:
         state.ui_state.selected_territory_id = self.context.new_territory_id
 
-    def revert(self, state: GameState) -> None:
+    def revert(self, state: "GameState") -> None:
         state.ui_state.selected_territory_id = self.context.previous_territory_id
 
 class TriggerAttackPopupEvent(Event):
@@ -44,8 +63,5 @@ class TriggerAttackPopupEvent(Event):
     def __init__(self, attacker_id: int, defender_id: int):
         super().__init__(
             "Trigger Attack Popup Event",
-            dict(
-                attacker_id=attacker_id,
-                defender_id=defender_id
-            )
+            TriggerAttackPopupContext(attacker_id, defender_id)
         )
\ No newline at end of file
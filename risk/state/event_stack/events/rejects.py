@@ -1,6 +1,39 @@
 
-from ..events import Event
-from abc import ABC
+from typing import NamedTuple
+
+from ._base import Event, ABC
+
+__all__ = [
+    "Rejected",
+    "RejectTroopPlacement",
+    "RejectAttack",
+    "RejectTransfer",
+]
+
+
+class RejectTroopPlacementContext(NamedTuple):
+    territory: int
+    num_troops: int
+    turn_number: int
+    player: str
+    reason: str
+
+
+class RejectAttackContext(NamedTuple):
+    turn_number: int
+    player: str
+    attacking_territory: int
+    defending_territory: int
+    reason: str
+
+
+class RejectTransferContext(NamedTuple):
+    turn_number: int
+    player: str
+    from_territory: int
+    to_territory: int
+    num_troops: int
+    reason: str
 
 class Rejected(Event, ABC):
     """
@@ -19,12 +52,8 @@ class RejectTroopPlacement(Rejected):
         reason: str):
         super().__init__(
             f"Reject-Troop-Placement-T{territory}-L{num_troops}-T{turn_number}: {reason}",
-            dict(
-                territory = territory,
-                num_troops = num_troops,
-                turn_number=turn_number,
-                player=player,
-                reason=reason
+            RejectTroopPlacementContext(
+                territory, num_troops, turn_number, player, reason
             )
         )
 
@@ -40,12 +69,8 @@ class RejectAttack(Rejected):
         reason: str):
         super().__init__(
             f"Reject-Attack-T{turn_number}-P{player}-AT{attacking_territory}-DT{defending_territory}: {reason}",
-            dict(
-                turn_number=turn_number,
-                player=player,
-                attacking_territory=attacking_territory,
-                defending_territory=defending_territory,
-                reason=reason
+            RejectAttackContext(
+                turn_number, player, attacking_territory, defending_territory, reason
             )
         )
 
@@ -62,12 +87,7 @@ class RejectTransfer(Rejected):
         reason: str):
         super().__init__(
             f"Reject-Transfer-T{turn_number}-P{player}-FT{from_territory}-TT{to_territory}-U{num_troops}: {reason}",
-            dict(
-                turn_number=turn_number,
-                player=player,
-                from_territory=from_territory,
-                to_territory=to_territory,
-                num_troops=num_troops,
-                reason=reason
+            RejectTransferContext(
+                turn_number, player, from_territory, to_territory, num_troops, reason
             )
         )
\ No newline at end of file
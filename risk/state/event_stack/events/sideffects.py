@@ -3,9 +3,67 @@ This module contains the logic for producing a side effect
 on the world state or a presumed world state.
 """
 
-from ..events import Event
-from ...game_state import GameState
-from abc import ABC, abstractmethod
+from ._base import Event, ABC, abstractmethod, context_repr
+from typing import Dict, NamedTuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ...game_state import GameState
+
+__all__ = [
+    "SideEffect",
+    "SideEffectEvent",
+    "UpdateReinforcements",
+    "ClearReinforcements",
+    "AdjustArmies",
+    "TransferArmies",
+    "CaptureTerritory",
+    "CasualitiesOnTerritory",
+    "ClearTerritory",
+    "UpdateState",
+    "EndTurn",
+    "PlayerRuntimeAdjust",
+]
+
+
+class PlayerContext(NamedTuple):
+    player_id: int
+
+
+class RemainingContext(NamedTuple):
+    remaining: int
+
+
+class ArmiesContext(NamedTuple):
+    territory_id: str
+    num_armies: int
+
+
+class TransferArmiesContext(NamedTuple):
+    from_territory_id: str
+    to_territory_id: str
+    num_armies: int
+
+
+class CaptureTerritoryContext(NamedTuple):
+    territory_id: str
+    new_owner_id: int
+    previous_owner_id: int
+    previous_armies: int
+
+
+class CasualitiesContext(NamedTuple):
+    territory_id: str
+    num_casualties: int
+
+
+class ClearTerritoryContext(NamedTuple):
+    territory_id: str
+    previous_owner_id: int
+
+
+class RuntimeContext(NamedTuple):
+    player: int
+    runtime: float
 
 
 class SideEffect(ABC):
@@ -16,9 +74,9 @@ class SideEffect(ABC):
 
     .. required-methods ::
         - apply:
-            `apply(state: GameState) -> None`
+            `apply(state: "GameState") -> None`
         - revert:
-            `revert(state: GameState) -> None`
+            `revert(state: "GameState") -> None`
 
     """
 
@@ -49,6 +107,10 @@ class SideEffectEvent(Event, SideEffect):
     """
     An event that produces a side effect on the world state.
 
+    Side effects with a `NamedTuple` context may leave out the description
+    and declare a `_NAME_FMT` template instead, so that the description is
+    only formatted when the event is printed or hashed.
+
     .. attributes ::
        - description:
             `str`
@@ -56,13 +118,26 @@ class SideEffectEvent(Event, SideEffect):
 
     .. required-methods ::
         - apply:
-            `apply(state: GameState) -> None`
+            `apply(state: "GameState") -> None`
         - revert:
-            `revert(state: GameState) -> None`
+            `revert(state: "GameState") -> None`
     """
 
+    def __init__(
+        self, description: str = None, context: Union[Dict, NamedTuple] = None
+    ):
+        super().__init__(description, context)
+
+    @property
+    def description(self) -> str:
+        """
+        The description of the side effect, which doubles as the name of
+        the event.
+        """
+        return self.name
+
     def __str__(self):
-        return f"SideEffect: {self.name}, Context: {str(self.context)}"
+        return f"SideEffect: {self.description}, Context: {context_repr(self.context)}"
 
 
 class UpdateReinforcements(SideEffectEvent):
@@ -74,16 +149,16 @@ class UpdateReinforcements(SideEffectEvent):
         - player_id
     """
 
+    _NAME_FMT = "Setup reinforcements for player {player_id}"
+
     def __init__(self, player_id: int):
-        super().__init__(
-            f"Setup reinforcements for player {player_id}", dict(player_id=player_id)
-        )
+        super().__init__(context=PlayerContext(player_id))
 
-    def apply(self, state: GameState) -> None:
+    def apply(self, state: "GameState") -> None:
         reinforcements = state.calculate_reinforcements(self.context.player_id)
         state.placements_left = reinforcements
 
-    def revert(self, state: GameState) -> None:
+    def revert(self, state: "GameState") -> None:
         state.placements_left = 0
 
 
@@ -96,7 +171,7 @@ class ClearReinforcements(SideEffectEvent):
     """
 
     def __init__(self, remaining: int):
-        super().__init__("Clear reinforcements.", dict(remaining=remaining))
+        super().__init__("Clear reinforcements.", RemainingContext(remaining))
 
     def apply(self, state):
         state.placements_left = 0
@@ -119,11 +194,10 @@ class AdjustArmies(SideEffectEvent):
 
     """
 
+    _NAME_FMT = "Adjust Armies: Add {num_armies} armies to territory {territory_id}"
+
     def __init__(self, territory_id: str, num_armies: int):
-        super().__init__(
-            f"Adjust Armies: Add {num_armies} armies to territory {territory_id}",
-            dict(territory_id=territory_id, num_armies=num_armies),
-        )
+        super().__init__(context=ArmiesContext(territory_id, num_armies))
 
     def apply(self, state: "GameState") -> None:
         territory = state.get_territory(self.context.territory_id)
@@ -149,13 +223,15 @@ class TransferArmies(SideEffectEvent):
         - context.num_armies
     """
 
+    _NAME_FMT = (
+        "Transfer Armies: Move {num_armies} armies "
+        "from {from_territory_id} to {to_territory_id}"
+    )
+
     def __init__(self, from_territory_id: str, to_territory_id: str, num_armies: int):
         super().__init__(
-            f"Transfer Armies: Move {num_armies} armies from {from_territory_id} to {to_territory_id}",
-            dict(
-                from_territory_id=from_territory_id,
-                to_territory_id=to_territory_id,
-                num_armies=num_armies,
+            context=TransferArmiesContext(
+                from_territory_id, to_territory_id, num_armies
             ),
         )
 
@@ -184,15 +260,21 @@ class CaptureTerritory(SideEffectEvent):
         - context.territory_id
         - context.new_owner_id
         - context.previous_owner_id
+        - context.previous_armies
     """
 
-    def __init__(self, territory_id: str, new_owner_id: int, previous_owner_id: int):
+    _NAME_FMT = "Capture Territory: {territory_id} by {new_owner_id}"
+
+    def __init__(
+        self,
+        territory_id: str,
+        new_owner_id: int,
+        previous_owner_id: int,
+        previous_armies: int = 0,
+    ):
         super().__init__(
-            f"Capture Territory: {territory_id} by {new_owner_id}",
-            dict(
-                territory_id=territory_id,
-                new_owner_id=new_owner_id,
-                previous_owner_id=previous_owner_id,
+            context=CaptureTerritoryContext(
+                territory_id, new_owner_id, previous_owner_id, previous_armies
             ),
         )
 
@@ -201,14 +283,14 @@ class CaptureTerritory(SideEffectEvent):
         if territory:
             territory.set_owner(self.context.new_owner_id)
             territory.armies = 0
-        state.update_player_statistics()
+        state.mark_statistics_dirty()
 
     def revert(self, state: "GameState") -> None:
         territory = state.get_territory(self.context.territory_id)
         if territory:
             territory.set_owner(self.context.previous_owner_id)
-            territory.armies = 0
-        state.update_player_statistics()
+            territory.armies = self.context.previous_armies
+        state.mark_statistics_dirty()
 
 
 class CasualitiesOnTerritory(SideEffectEvent):
@@ -220,13 +302,18 @@ class CasualitiesOnTerritory(SideEffectEvent):
         - context.num_casualties
     """
 
+    _NAME_FMT = (
+        "Casualties on Territory: Remove {num_casualties} armies "
+        "from territory {territory_id}"
+    )
+
     def __init__(self, territory_id: str, num_casualties: int):
-        super().__init__(
-            f"Casualties on Territory: Remove {num_casualties} armies from territory {territory_id}",
-            dict(territory_id=territory_id, num_casualties=num_casualties),
-        )
+        super().__init__(context=CasualitiesContext(territory_id, num_casualties))
 
     def apply(self, state: "GameState") -> None:
+        if self.context.num_casualties == 0:
+            return None
+
         territory = state.get_territory(self.context.territory_id)
         if territory:
             territory.remove_armies(self.context.num_casualties)
@@ -234,15 +321,18 @@ class CasualitiesOnTerritory(SideEffectEvent):
         if territory.armies < 1:
             return [ClearTerritory(territory.id, territory.owner)]
 
-        state.update_player_statistics()
+        state.mark_statistics_dirty()
 
     def revert(self, state: "GameState") -> None:
+        if self.context.num_casualties == 0:
+            return None
+
         territory = state.get_territory(self.context.territory_id)
 
         if territory:
             territory.add_armies(self.context.num_casualties)
 
-        state.update_player_statistics()
+        state.mark_statistics_dirty()
 
 
 class ClearTerritory(SideEffectEvent):
@@ -254,23 +344,24 @@ class ClearTerritory(SideEffectEvent):
         - context.previous_owner_id
     """
 
+    _NAME_FMT = "Clear Territory: {territory_id}"
+
     def __init__(self, territory_id: str, previous_owner_id: int):
         super().__init__(
-            f"Clear Territory: {territory_id}",
-            dict(territory_id=territory_id, previous_owner_id=previous_owner_id),
+            context=ClearTerritoryContext(territory_id, previous_owner_id)
         )
 
     def apply(self, state: "GameState") -> None:
         territory = state.get_territory(self.context.territory_id)
         if territory:
             territory.set_owner(None)
-        state.update_player_statistics()
+        state.mark_statistics_dirty()
 
     def revert(self, state: "GameState") -> None:
         territory = state.get_territory(self.context.territory_id)
         if territory:
             territory.set_owner(self.context.previous_owner_id)
-        state.update_player_statistics()
+        state.mark_statistics_dirty()
 
 
 class UpdateState(SideEffectEvent):
@@ -279,7 +370,7 @@ class UpdateState(SideEffectEvent):
     """
 
     def __init__(self):
-        super().__init__("UpdateStatistics", {})
+        super().__init__("UpdateStatistics")
 
     def apply(self, state: "GameState") -> None:
         state.update_player_statistics()
@@ -294,7 +385,7 @@ class EndTurn(SideEffectEvent):
     """
 
     def __init__(self):
-        super().__init__("EndTurn", {})
+        super().__init__("EndTurn")
 
     def apply(self, state: "GameState") -> None:
         state.advance_turn()
@@ -309,7 +400,7 @@ class PlayerRuntimeAdjust(SideEffectEvent):
     """
 
     def __init__(self, player: int, runtime: float):
-        super().__init__("AdjustPlayerRuntime", {"player": player, "runtime": runtime})
+        super().__init__("AdjustPlayerRuntime", RuntimeContext(player, runtime))
 
     def apply(self, state):
         state.players[self.context.player].runtime += self.context.runtime
@@ -1,4 +1,18 @@
-from ..events import Event 
+from typing import NamedTuple
+
+from ._base import Event
+
+__all__ = [
+    "PauseProcessingEvent",
+    "SystemInterruptEvent",
+    "SystemResumeEvent",
+    "SystemStepEvent",
+]
+
+
+class PauseProcessingContext(NamedTuple):
+    delay: float
+
 
 class PauseProcessingEvent(Event):
     """
@@ -12,9 +26,7 @@ class PauseProcessingEvent(Event):
     def __init__(self, delay: float):
         super().__init__(
             f"SYSTEM: Paused Processing of Event Stack for {delay}",
-            dict(
-                delay=delay
-            )
+            PauseProcessingContext(delay)
         )
 
 class SystemInterruptEvent(Event):
@@ -1,6 +1,71 @@
-from ..stack import Event, Level
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Type, Union
+
+from ._base import Event, Level
 from ...territory import Territory
 
+__all__ = [
+    "PlayingEvent",
+    "AgentTurnPhase",
+    "AgentTurnEndEvent",
+    "PlacementPhase",
+    "TroopPlacementEvent",
+    "TroopPlacementBatch",
+    "PlacementPhaseEndEvent",
+    "AttackPhase",
+    "AttackOnTerritoryEvent",
+    "CasualtyEvent",
+    "CaptureTerritoryEvent",
+    "AttackPhaseEndEvent",
+    "MovementPhase",
+    "MovementOfTroopsEvent",
+    "MovementPhaseEndEvent",
+    "phase_event",
+]
+
+
+class PhaseContext(NamedTuple):
+    turn_number: int
+    player: str
+
+
+class TroopPlacementContext(NamedTuple):
+    territory: int
+    num_troops: int
+    turn: int
+    player: str
+
+
+class AttackOnTerritoryContext(NamedTuple):
+    from_territory: int
+    to_territory: int
+    attacking_troops: int
+    turn: int
+    player: str
+
+
+class CasualtyContext(NamedTuple):
+    territory: int
+    num_casualties: int
+    turn_number: int
+
+
+class CaptureTerritoryEventContext(NamedTuple):
+    player: str
+    turn_number: int
+    territory: int
+    conquered_from: int
+    conquered_troops: int
+
+
+class MovementOfTroopsContext(NamedTuple):
+    player: str
+    turn: int
+    from_territory: int
+    to_territory: int
+    moving_troops: int
+
+
 class PlayingEvent(Event):
     """
     An event representing the playing state of the game.
@@ -21,13 +86,11 @@ class AgentTurnEndEvent(Event):
     A signal to the engines that the agent's turn is complete.
     """
 
+    _NAME_FMT = "Agent Turn End - T{turn_number} - {player}"
+
     def __init__(self, turn_number: int, player: str):
         super().__init__(
-            f"Agent Turn End - T{turn_number} - {player}", 
-            dict(
-                turn_number=turn_number,
-                player=player
-            )
+            context=PhaseContext(turn_number, player)
         )
 
 class PlacementPhase(Level):
@@ -45,38 +108,68 @@ class TroopPlacementEvent(Event):
     An event representing the placement of troops.
     """
 
+    _NAME_FMT = "Troop Placement-T{turn}-P{player}-R{territory}x{num_troops}"
+
     def __init__(self, 
         turn:int, player: str, territory: int, num_troops: int):
         super().__init__(
-          f"Troop Placement-T{turn}-P{player}-R{territory}x{num_troops}",
-          dict(
-              territory=territory,
-              num_troops=num_troops,
-              turn=turn,
-              player=player
-          )
+          context=TroopPlacementContext(territory, num_troops, turn, player)
         )
 
     def __repr__(self) -> str:
-        ret = f"TroopPlacementEvent({repr(self.context.turn)}, "
-        ret += f"{repr(self.context.player)}, "
-        ret += f"{repr(self.context.territory)}, "
-        ret += f"{repr(self.context.num_troops)})"
-        return ret
-    
+        context = self.context
+        return (
+            f"TroopPlacementEvent({context.turn!r}, {context.player!r}, "
+            f"{context.territory!r}, {context.num_troops!r})"
+        )
+
+
+class TroopPlacementBatch:
+    """
+    Collects the placements made by a player within a turn, combining
+    placements onto the same territory, so that a burst of single troop
+    placements only materialises one event per territory.
+    """
+
+    __slots__ = ("turn", "player", "_troops")
+
+    def __init__(self, turn: int, player: str):
+        self.turn = turn
+        self.player = player
+        self._troops: Dict[int, int] = {}
+
+    def append(self, territory: int, num_troops: int = 1) -> None:
+        """
+        Adds a placement of troops onto the given territory.
+        """
+        self._troops[territory] = self._troops.get(territory, 0) + num_troops
+
+    def events(self) -> List[TroopPlacementEvent]:
+        """
+        Materialises the placements as events, in the order that each
+        territory was first placed on.
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[TroopPlacementEvent]:
+        for territory, num_troops in self._troops.items():
+            yield TroopPlacementEvent(self.turn, self.player, territory, num_troops)
+
+    def __len__(self) -> int:
+        return len(self._troops)
+
+
 class PlacementPhaseEndEvent(Event):
     """
     A signal to the engines that the plan for the placement phase is
     complete.
     """
 
+    _NAME_FMT = "Placement Phase End - T{turn_number} - {player}"
+
     def __init__(self, turn_number: int, player: str):
         super().__init__(
-            f"Placement Phase End - T{turn_number} - {player}", 
-            dict(
-                turn_number=turn_number,
-                player=player
-            )
+            context=PhaseContext(turn_number, player)
         )
 
 class AttackPhase(Level):
@@ -99,19 +192,16 @@ class AttackOnTerritoryEvent(Event):
         - context.turn
     """
 
+    _NAME_FMT = "Attack-F{from_territory}-to-D{to_territory}-with-A{attacking_troops}"
+
     def __init__(self, 
             player: str, turn:int, 
             from_territory: int, 
             to_territory: int, 
             attacking_troops: int):
         super().__init__(
-            f"Attack-F{from_territory}-to-D{to_territory}-with-A{attacking_troops}",
-            dict(
-                from_territory=from_territory,
-                to_territory=to_territory,
-                attacking_troops=attacking_troops,
-                turn=turn,
-                player=player
+            context=AttackOnTerritoryContext(
+                from_territory, to_territory, attacking_troops, turn, player
             )
         )
         
@@ -120,15 +210,12 @@ class CasualtyEvent(Event):
     An event representing casualties in an attack.
     """
 
+    _NAME_FMT = "Casualties-in-T{territory}-L{num_casualties}-T{turn_number}"
+
     def __init__(self, 
         turn_number:int, territory: int, num_casualties: int):
         super().__init__(
-            f"Casualties-in-T{territory}-L{num_casualties}-T{turn_number}",
-            dict(
-                territory = territory,
-                num_casualties = num_casualties,
-                turn_number=turn_number
-            )
+            context=CasualtyContext(territory, num_casualties, turn_number)
         )
     
 class CaptureTerritoryEvent(Event):
@@ -136,19 +223,15 @@ class CaptureTerritoryEvent(Event):
     An event representing the capture of a territory.
     """
 
+    _NAME_FMT = "Captured-C{territory}-from-F{conquered_from}-moving-S{conquered_troops}"
+
     def __init__(self, 
         player: str, turn_number:int, 
         territory: int, conquered_from: int, 
         conquered_troops: int):
         super().__init__(
-            f"Captured-C{territory}-from-F{conquered_from}-moving-" \
-            + f"S{conquered_troops}",
-            dict(
-                player = player,
-                turn_number = turn_number,
-                territory = territory,
-                conquered_from = conquered_from,
-                conquered_troops = conquered_troops
+            context=CaptureTerritoryEventContext(
+                player, turn_number, territory, conquered_from, conquered_troops
             )
         )
 
@@ -159,13 +242,11 @@ class AttackPhaseEndEvent(Event):
     complete.
     """
 
+    _NAME_FMT = "Attack Phase End-T{turn_number}-P{player}"
+
     def __init__(self, turn_number: int, player: str):
         super().__init__(
-            f"Attack Phase End-T{turn_number}-P{player}", 
-            dict(
-                turn_number=turn_number,
-                player=player
-            )
+            context=PhaseContext(turn_number, player)
         )
 
 class MovementPhase(Level):
@@ -191,18 +272,15 @@ class MovementOfTroopsEvent(Event):
         - context.turn
     """
 
+    _NAME_FMT = "Movement of Troops-S{from_territory}-of-M{moving_troops}-to-E{to_territory}"
+
     def __init__(self, 
         player: str, turn:int, 
         from_territory: int, to_territory: int, 
         moving_troops: int):
         super().__init__(
-            f"Movement of Troops-S{from_territory}-of-M{moving_troops}-to-E{to_territory}",
-            dict(
-                player = player,
-                turn = turn,
-                from_territory = from_territory,
-                to_territory = to_territory,
-                moving_troops = moving_troops,
+            context=MovementOfTroopsContext(
+                player, turn, from_territory, to_territory, moving_troops
             )
         )
 
@@ -212,12 +290,22 @@ class MovementPhaseEndEvent(Event):
     complete.
     """
 
+    _NAME_FMT = "Movement Phase End-T{turn_number}-P{player}"
+
     def __init__(self, turn_number: int, player: str):
         super().__init__(
-            f"Movement Phase End-T{turn_number}-P{player}", 
-            dict(
-                turn_number=turn_number,
-                player=player
-            )
+            context=PhaseContext(turn_number, player)
         )
 
+
+@lru_cache(maxsize=4096)
+def phase_event(
+    phase: Type[Union[Level, Event]], turn_number: int, player: str
+) -> Union[Level, Event]:
+    """
+    Returns a shared instance of a phase level or phase end event for the
+    given turn and player. These elements are immutable and only vary by
+    turn and player, so repeated requests for the same phase reuse one
+    instance rather than building a new one.
+    """
+    return phase(turn_number, player)
@@ -1,7 +1,19 @@
 
-from ..events import Event
+from typing import NamedTuple
+
+from ._base import Event
 from ...ui import UIAction
 
+__all__ = [
+    "UIActionEvent",
+]
+
+
+class UIActionContext(NamedTuple):
+    action: UIAction
+    parameters: dict
+
+
 class UIActionEvent(Event):
     """
     Event representing a UI action.
@@ -10,8 +22,5 @@ class UIActionEvent(Event):
     def __init__(self, action: UIAction, parameters: dict):
         super().__init__(
             "UI Action Event :: {}".format(action.name),
-            dict(
-                action=action,
-                parameters=parameters
-            )
+            UIActionContext(action, parameters)
         )
\ No newline at end of file
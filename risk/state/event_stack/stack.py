@@ -3,7 +3,12 @@ This module describes the event stack data structure used
 to manage simulation events.
 """
 
-from typing import Union, Dict, List
+from collections import deque
+from functools import cached_property
+from itertools import islice
+from string import Formatter
+from sys import intern
+from typing import Union, Dict, Iterable, NamedTuple, Tuple
 from uuid import uuid5, UUID
 
 EVENT_NAMESPACE = UUID("83565e68-4400-496e-a9fe-932f80bcf803")
@@ -18,58 +23,132 @@ class EventContext:
 
     def __init__(self, context: Dict[str, object] = None):
         if context is not None:
-            for key, val in context.items():
-                setattr(self, key, val)
-        self._lock = 1
+            self.__dict__.update(context)
 
     def _make_dict(self) -> Dict[str, object]:
-        return dict(
-            (attr, getattr(self, attr)) for attr in self.__dict__ if attr != "_lock"
-        )
+        return dict(self.__dict__)
 
     def __getitem__(self, key):
         return getattr(self, key)
 
     def __setattr__(self, name, value):
-        if hasattr(self, "_lock"):
-            raise TypeError("Contexts are immutable!")
-        else:
-            super().__setattr__(name, value)
+        raise TypeError("Contexts are immutable!")
 
     def __repr__(self):
         return repr(self._make_dict())
 
 
+# contexts are immutable, so all events without a context share one
+_EMPTY_CONTEXT = EventContext()
+
+
+def _positional_template(template: str, fields: Tuple[str, ...]) -> str:
+    """
+    Rewrites a template over named fields into one over the positions of
+    those fields, so that it can be filled straight from a tuple.
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            conversion = f"!{conversion}" if conversion else ""
+            spec = f":{spec}" if spec else ""
+            parts.append(f"{{{fields.index(field)}{conversion}{spec}}}")
+    return "".join(parts)
+
+
+# positional forms of the name templates, filled in per event class
+_NAME_TEMPLATES: Dict[type, str] = {}
+
+
+def context_repr(context: Union[EventContext, NamedTuple]) -> str:
+    """
+    Renders the context of an event as a dictionary, so that tuple-backed
+    contexts and dictionary-backed contexts share the same textual form.
+    """
+    if isinstance(context, tuple):
+        return repr(context._asdict())
+    return repr(context)
+
+
 class Event:
     """
     A base class for events in the simulation.
+
+    The context of an event is either given as a dictionary or as keyword
+    arguments, which are wrapped in an `EventContext`, or as a `NamedTuple`
+    specific to the event type, which is used directly as the context.
+
+    Subclasses with a `NamedTuple` context may leave out the name and
+    instead declare a `_NAME_FMT` template over the fields of their
+    context, which is only formatted when the name is first needed.
+
+    Events are immutable once constructed, so their attributes are only
+    assigned through `object.__setattr__` during construction.
     """
 
-    def __init__(self, name: str, context: Dict[str, object] = None):
-        self.name = name
-        self.context = EventContext(context) if context is not None else EventContext()
-        self.id = uuid5(EVENT_NAMESPACE, str(self))
-        self._lock = 1
+    _NAME_FMT: str = None
+
+    def __init__(
+        self,
+        name: str = None,
+        context: Union[Dict[str, object], NamedTuple] = None,
+        **fields: object,
+    ):
+        if name is not None:
+            object.__setattr__(self, "name", intern(name))
+        if fields:
+            if isinstance(context, tuple):
+                fields = {**context._asdict(), **fields}
+            elif context:
+                fields = {**context, **fields}
+            object.__setattr__(self, "context", EventContext(fields))
+        elif isinstance(context, tuple):
+            object.__setattr__(self, "context", context)
+        elif not context:
+            object.__setattr__(self, "context", _EMPTY_CONTEXT)
+        else:
+            object.__setattr__(self, "context", EventContext(context))
+
+    @cached_property
+    def name(self) -> str:
+        template = _NAME_TEMPLATES.get(type(self))
+        if template is None:
+            template = _positional_template(self._NAME_FMT, self.context._fields)
+            _NAME_TEMPLATES[type(self)] = template
+        return intern(template.format(*self.context))
+
+    @cached_property
+    def _key(self) -> str:
+        """
+        The identifying text of the event, which is only formatted the
+        first time the event is hashed or compared. The text is interned,
+        so that equal events share one string and compare by identity.
+        """
+        return intern(str(self))
+
+    @cached_property
+    def id(self) -> UUID:
+        return uuid5(EVENT_NAMESPACE, self._key)
 
     def __str__(self) -> str:
-        return f"Event: {self.name}, Context: {self.context}"
+        return f"Event: {self.name}, Context: {context_repr(self.context)}"
 
     def __repr__(self) -> str:
-        return f"Event({repr(self.name)},{repr(self.context)})"
+        return f"Event({self.name!r},{context_repr(self.context)})"
 
     def __hash__(self):
-        return hash(self.id)
+        return hash(self._key)
 
     def __eq__(self, value):
+        if self is value:
+            return True
         if isinstance(value, Event):
-            return self.id == value.id
+            return self._key == value._key
         return False
 
     def __setattr__(self, name, value):
-        if hasattr(self, "_lock"):
-            raise TypeError("Events are immutable!")
-        else:
-            super().__setattr__(name, value)
+        raise TypeError("Events are immutable!")
 
 
 class Level:
@@ -78,33 +157,41 @@ class Level:
     """
 
     def __init__(self, name: str):
-        self.name = name
-        self.id = uuid5(LEVEL_NAMESPACE, str(self))
-        self._lock = 1
+        object.__setattr__(self, "name", intern(name))
+
+    @cached_property
+    def _key(self) -> str:
+        return intern(str(self))
+
+    @cached_property
+    def id(self) -> UUID:
+        return uuid5(LEVEL_NAMESPACE, self._key)
 
     def __str__(self) -> str:
         return f"Level: {self.name}"
 
     def __repr__(self) -> str:
-        return f"Level({repr(self.name)})"
+        return f"Level({self.name!r})"
 
     def __setattr__(self, name, value):
-        if hasattr(self, "_lock"):
-            raise TypeError("Levels are immutable!")
-        super().__setattr__(name, value)
+        raise TypeError("Levels are immutable!")
 
     def __eq__(self, value):
+        if self is value:
+            return True
         if isinstance(value, Level):
-            return self.id == value.id
+            return self._key == value._key
         return False
 
     def __hash__(self):
-        return hash(self.id)
+        return hash(self._key)
 
 
 class EventStackInfo:
-    current_level: Union[Level, None] = None
-    depth: int = 0
+    __slots__ = ("current_level", "depth")
+
+    current_level: Union[Level, None]
+    depth: int
 
     def __init__(self):
         self.current_level = None
@@ -116,39 +203,56 @@ class EventStack:
     A stack to manage simulation events.
     """
 
-    def __init__(self, name: str, layers: List[Union[Event, Level]] = None):
-        self.stack = []
-        self.name = name
-        self.id = uuid5(STACK_NAMESPACE, name)
-        self._info = EventStackInfo()
+    def __init__(self, name: str, layers: Iterable[Union[Event, Level]] = None):
+        object.__setattr__(self, "stack", deque())
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "_info", EventStackInfo())
+        # the levels currently on the stack, in push order
+        object.__setattr__(self, "_levels", [])
         if layers:
             for layer in layers:
                 self.push(layer)
-        self._lock = 1
 
     def push(self, element: Union[Level, Event]) -> None:
         """
         Push an event onto the stack.
         """
         if isinstance(element, Level):
-            self._info.depth += 1
-            self._info.current_level = element
+            info = self._info
+            info.depth += 1
+            info.current_level = element
+            self._levels.append(element)
         self.stack.append(element)
 
+    def extend(self, elements: Iterable[Union[Level, Event]]) -> None:
+        """
+        Push a sequence of elements onto the stack, in order, as if each
+        had been pushed in turn.
+        """
+        elements = list(elements)
+        levels = [el for el in elements if isinstance(el, Level)]
+        if levels:
+            info = self._info
+            info.depth += len(levels)
+            info.current_level = levels[-1]
+            self._levels.extend(levels)
+        self.stack.extend(elements)
+
     def pop(self) -> Union[None, Level, Event]:
         """
         Pop an event off the stack.
         """
-        if self.is_empty:
+        stack = self.stack
+        if not stack:
             return None
-        if isinstance(self.peek(), Level):
-            self._info.depth -= 1
-            if self.depth > 0:
-                self._info.current_level = self._find_next_level(self.stack[:-1])
-            else:
-                self._info.current_level = None
+        if isinstance(stack[-1], Level):
+            levels = self._levels
+            levels.pop()
+            info = self._info
+            info.depth -= 1
+            info.current_level = levels[-1] if levels else None
 
-        return self.stack.pop()
+        return stack.pop()
 
     def peek(self) -> Union[None, Level, Event]:
         """
@@ -158,15 +262,6 @@ class EventStack:
             return None
         return self.stack[-1]
 
-    def _find_next_level(self, stack) -> Union[None, Level]:
-        """
-        Walks the stack to find the closest level.
-        """
-        for item in reversed(stack):
-            if isinstance(item, Level):
-                return item
-        return None
-
     @property
     def current_level(self) -> Union[None, Level]:
         """
@@ -202,15 +297,19 @@ class EventStack:
         to `layers` in it.
         """
 
-        return EventStack(self.name + f"-sub-{layers}", layers=self.stack[:layers])
+        start, stop, _ = slice(None, layers).indices(len(self.stack))
+        return EventStack(
+            self.name + f"-sub-{layers}", layers=islice(self.stack, start, stop)
+        )
 
     def topstack(self, layers: int):
         """
         From the top to bottom, create a substack fo the current stack with
         up to `layers` in it.
         """
+        start, stop, _ = slice(-1 * layers, None).indices(len(self.stack))
         return EventStack(
-            self.name + f"-sub-{layers}", layers=self.stack[-1 * layers :]
+            self.name + f"-sub-{layers}", layers=islice(self.stack, start, stop)
         )
 
     def clear(self):
@@ -218,29 +317,37 @@ class EventStack:
         Clears the stack.
         """
         self.stack.clear()
+        self._levels.clear()
+        self._info.depth = 0
+        self._info.current_level = None
 
     def __len__(self):
         return self.size
 
     def __setattr__(self, name, value):
-        if hasattr(self, "_lock"):
-            raise TypeError("Stacks are immutable, outside of modifying the stack")
-        super().__setattr__(name, value)
+        raise TypeError("Stacks are immutable, outside of modifying the stack")
+
+    @cached_property
+    def id(self) -> UUID:
+        return uuid5(STACK_NAMESPACE, self.name)
 
     def __hash__(self):
-        return hash(self.id)
+        return hash(self.name)
 
     def __eq__(self, value):
+        if self is value:
+            return True
         if isinstance(value, EventStack):
-            return self.id == value.id
+            return self.name == value.name
         return False
 
     def __str__(self):
-        ret = "Stack:-\n"
+        lines = ["Stack:-"]
         depth = self.depth
         for el in reversed(self.stack):
-            text = str(el)
-            ret += "  ".join(["" for _ in range(depth)]) + text + "\n"
+            # elements at depth d are indented by d - 1 steps
+            lines.append(f"{'  ' * (depth - 1)}{el}")
             if isinstance(el, Level):
                 depth -= 1
-        return ret
+        lines.append("")
+        return "\n".join(lines)
@@ -5,23 +5,35 @@ meant to be historical recording of a simulation.
 """
 
 from .stack import EventStack, Event, Level
-from typing import List, Tuple, Type, Dict, Set, Union
+from array import array
+from collections import deque
+from typing import Iterable, List, Tuple, Type, Dict, Union, FrozenSet
 from dataclasses import dataclass, field
 
 @dataclass
 class EventTapeInfo:
     current_level:Union[Level, None]=None
     depth:int=0
-    starts:Set[Union[Type[Event], Type[Level]]]=field(default_factory=set)
-    ends:Set[Type[Event]]=field(default_factory=set)
+    starts:FrozenSet[Union[Type[Event], Type[Level]]]=field(default_factory=frozenset)
+    ends:FrozenSet[Type[Event]]=field(default_factory=frozenset)
     seen_parents:List[int]=field(default_factory=list)
     last_seen:int=-1
 
+    def __post_init__(self):
+        # maps an element type to +1 when it opens a pair and -1 when it
+        # closes one, so each element costs a single lookup
+        self._deltas: Dict[Union[Type[Event], Type[Level]], int] = {}
+        for end in self.ends:
+            self._deltas[end] = -1
+        for start in self.starts:
+            self._deltas[start] = 1
+
     def _cal_depth(self, event: Union[Event,Level]) -> int:
         """
         Calculate depth based on hierarchical pairs.
         """
-        if type(event) in self.starts:
+        delta = self._deltas.get(type(event), 0)
+        if delta > 0:
             # push a new depth into seen parents
             if self.last_seen >= 0:
                 self.seen_parents.append(
@@ -33,7 +45,7 @@ class EventTapeInfo:
                 self.last_seen = 0
             return self.seen_parents[self.last_seen] - 1
         
-        elif type(event) in self.ends:
+        elif delta < 0:
             # shift back the depth
             self.last_seen -= 1
 
@@ -52,7 +64,11 @@ class EventTape(EventStack):
     based on paired event classes rather than linear depth progression.
     """
 
-    def __init__(self, pairs: List[Tuple[Union[Type[Event], Type[Level]], Type[Event]]] = None):
+    def __init__(
+        self,
+        pairs: List[Tuple[Union[Type[Event], Type[Level]], Type[Event]]] = None,
+        capacity: int = None,
+    ):
         """
         Initialize EventTape with hierarchical pairs.
         
@@ -60,27 +76,35 @@ class EventTape(EventStack):
                      (start_class, end_class) where start_class can be Event 
                      or Level, and end_class must be Event - elements between 
                      these pairs will have increased hierarchical depth
+        :param capacity: The number of most recent elements to keep, where
+                     older elements are dropped as new ones are pushed. By
+                     default the tape keeps every element.
         :returns: None
         """
         super().__init__(name="EventTape")
-        del self._lock
-        
-        # Initialize all attributes before setting _lock
-        self._pairs = list() if pairs is None else pairs
-        if len(self._pairs) > 0:
-            self._starts = {pair[0] for pair in self._pairs}
-            self._ends = {pair[1] for pair in self._pairs}
-        else:
-            self._starts = set()
-            self._ends = set()
-        
-        self._info = EventTapeInfo(
-            0, None, self._starts, self._ends
+
+        # stacks are immutable, so attributes are set via object
+        pairs = list() if pairs is None else pairs
+        starts = frozenset(pair[0] for pair in pairs)
+        ends = frozenset(pair[1] for pair in pairs)
+        object.__setattr__(self, "_pairs", pairs)
+        object.__setattr__(self, "_starts", starts)
+        object.__setattr__(self, "_ends", ends)
+        object.__setattr__(
+            self, "_info", EventTapeInfo(starts=starts, ends=ends)
         )
+        object.__setattr__(self, "_capacity", capacity)
+        if capacity is not None:
+            # a bounded tape acts as a ring buffer over recent elements
+            object.__setattr__(self, "stack", deque(maxlen=capacity))
+        # the depth of each element, recorded as it is pushed
+        object.__setattr__(self, "_depths", self._new_depths())
+
+    def _new_depths(self) -> Union[array, deque]:
+        if self._capacity is None:
+            return array("I")
+        return deque(maxlen=self._capacity)
 
-        # Set lock last
-        self._lock = 1
-        
     def push(self, element: Union[Level, Event]) -> None:
         """
         Push element with hierarchical depth calculation.
@@ -88,10 +112,20 @@ class EventTape(EventStack):
         :param element: Event or Level to push onto tape
         :returns: None
         """
-        self._info.depth = self._info._cal_depth(element)
+        info = self._info
+        info.depth = info._cal_depth(element)
         if isinstance(element, Level):
-            self._info.current_level = element
+            info.current_level = element
         self.stack.append(element)
+        self._depths.append(info.depth)
+
+    def extend(self, elements: Iterable[Union[Level, Event]]) -> None:
+        """
+        Push each element in turn, as the depth of each element depends
+        on those before it.
+        """
+        for element in elements:
+            self.push(element)
 
     def pop(self):
         """
@@ -99,21 +133,25 @@ class EventTape(EventStack):
         """
         pass
 
+    def clear(self):
+        """
+        Clears the tape, along with its recorded depths.
+        """
+        super().clear()
+        object.__setattr__(self, "_depths", self._new_depths())
+        object.__setattr__(
+            self, "_info", EventTapeInfo(starts=self._starts, ends=self._ends)
+        )
+
     def __str__(self) -> str:
            
         ret = "EventTape:-\n"
         
-        # Reset state for display calculation
-        info = EventTapeInfo(
-            0, None, self._starts, self._ends, [], -1
-        )
-        
-        # Calculate depths and build display in reverse order
-        element_lines = []
-        for element in self.stack:
-            depth = info._cal_depth(element)
-            indent = "  " * depth
-            element_lines.append(f"{indent}{element}")
+        # Use the depths recorded on push to build the display
+        element_lines = [
+            f"{'  ' * depth}{element}"
+            for depth, element in zip(self._depths, self.stack)
+        ]
         
         # Display in reverse order (most recent first)
         ret += "\n".join(reversed(element_lines))
@@ -4,8 +4,11 @@ Represents contested territory battles with dice-based combat mechanics.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from enum import Enum
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import product
+import os
 import random
 
 
@@ -35,38 +38,338 @@ class FightResult(Enum):
         """Check if the fight is still ongoing."""
         return self == FightResult.ONGOING
 
+    def __str__(self) -> str:
+        return _FIGHT_RESULT_NAMES[self]
 
-@dataclass
+
+# results are drawn from a tiny fixed set, so their names are built once
+_FIGHT_RESULT_NAMES = {
+    result: f"{FightResult.__name__}.{result.name}" for result in FightResult
+}
+
+# faces of a six sided die
+_DIE_FACES = (1, 2, 3, 4, 5, 6)
+
+# dice rolled by each side, indexed by its armies capped at 4 and 2
+_ATT_DICE = (0, 1, 1, 2, 3)
+_DEF_DICE = (0, 1, 2)
+
+
+def _casualties_sorted(
+    attacker_dice: Sequence[int], defender_dice: Sequence[int]
+) -> Tuple[int, int]:
+    """
+    Calculate casualties for any number of dice by sorting both sides and
+    comparing them pairwise, highest against highest.
+
+    :returns: Tuple of (attacker_casualties, defender_casualties)
+    """
+    attacker_sorted = sorted(attacker_dice, reverse=True)
+    defender_sorted = sorted(defender_dice, reverse=True)
+
+    attacker_casualties = 0
+    defender_casualties = 0
+    for attack, defend in zip(attacker_sorted, defender_sorted):
+        if attack > defend:
+            defender_casualties += 1
+        else:  # Defender wins ties
+            attacker_casualties += 1
+
+    return attacker_casualties, defender_casualties
+
+
+def _sort2(first: int, second: int) -> Tuple[int, int]:
+    """Orders two dice from highest to lowest."""
+    return (first, second) if first >= second else (second, first)
+
+
+def _top2_of_3(first: int, second: int, third: int) -> Tuple[int, int]:
+    """Picks the two highest of three dice, highest first."""
+    if first < second:
+        first, second = second, first
+    if first < third:
+        first, third = third, first
+    if second < third:
+        second = third
+    return first, second
+
+
+def _top_dice(dice: Sequence[int]) -> Tuple[int, int]:
+    """
+    Picks out the highest and second highest of up to three dice. The
+    second is 0 for a single die, which no face can lose to.
+    """
+    count = len(dice)
+    if count == 1:
+        return dice[0], 0
+    if count == 2:
+        return _sort2(*dice)
+    return _top2_of_3(*dice)
+
+
+def _cas_from_sorted(
+    attack_high: int, attack_low: int, defend_high: int, defend_low: int
+) -> Tuple[int, int]:
+    """
+    Calculate casualties from the top two dice of each side, where a
+    second die of 0 means that side only rolled one. Ties go to defender.
+
+    :returns: Tuple of (attacker_casualties, defender_casualties)
+    """
+    if attack_high > defend_high:
+        attacker_casualties, defender_casualties = 0, 1
+    else:
+        attacker_casualties, defender_casualties = 1, 0
+    if attack_low and defend_low:
+        if attack_low > defend_low:
+            defender_casualties += 1
+        else:
+            attacker_casualties += 1
+
+    return attacker_casualties, defender_casualties
+
+
+def _casualties(
+    attacker_dice: Sequence[int], defender_dice: Sequence[int]
+) -> Tuple[int, int]:
+    """
+    Calculate casualties based on dice roll results. Higher dice win
+    battles, ties go to defender.
+
+    :returns: Tuple of (attacker_casualties, defender_casualties)
+    """
+    if not (0 < len(attacker_dice) <= 3 and 0 < len(defender_dice) <= 2):
+        return _casualties_sorted(attacker_dice, defender_dice)
+
+    # Only the highest dice of each side are compared, so the top one or
+    # two dice are picked out directly rather than sorting either side
+    return _cas_from_sorted(*_top_dice(attacker_dice), *_top_dice(defender_dice))
+
+
+@dataclass(slots=True)
 class DiceRoll:
     """Represents a single dice roll in combat."""
 
-    attacker_dice: List[int] = field(default_factory=list)
-    defender_dice: List[int] = field(default_factory=list)
+    attacker_dice: Sequence[int] = ()
+    defender_dice: Sequence[int] = ()
     attacker_casualties: int = 0
     defender_casualties: int = 0
 
     def __post_init__(self):
         """Calculate casualties based on dice results after initialization."""
-        if self.attacker_dice and self.defender_dice:
-            self._calculate_casualties()
+        # every roll costs at least one army, so zero casualties means
+        # they were not given
+        no_casualties = not (self.attacker_casualties or self.defender_casualties)
+        if no_casualties and self.attacker_dice and self.defender_dice:
+            self.attacker_casualties, self.defender_casualties = _casualties(
+                self.attacker_dice, self.defender_dice
+            )
 
-    def _calculate_casualties(self) -> None:
-        """
-        Calculate casualties based on dice roll results. Higher dice win
-        battles, ties go to defender.
-        """
-        # Sort dice in descending order for comparison
-        attacker_sorted = sorted(self.attacker_dice, reverse=True)
-        defender_sorted = sorted(self.defender_dice, reverse=True)
 
-        # Compare dice pairwise (highest vs highest, etc.)
-        battles = min(len(attacker_sorted), len(defender_sorted))
+def _build_outcomes() -> Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]]:
+    """
+    Enumerates every roll for each pairing of attacker and defender dice
+    counts, recording the (attacker, defender) casualties of each roll.
+    A roll of `a` attacker and `d` defender dice is indexed by reading its
+    faces, less one, as the digits of a base 6 number.
+    """
+    outcomes = {}
+    for attacker_count, defender_count in product((1, 2, 3), (1, 2)):
+        table = []
+        for faces in product(range(1, 7), repeat=attacker_count + defender_count):
+            table.append(
+                _casualties(faces[:attacker_count], faces[attacker_count:])
+            )
+        outcomes[(attacker_count, defender_count)] = tuple(table)
+    return outcomes
+
+
+# casualties for every possible roll, so a round costs one random draw
+_OUTCOMES = _build_outcomes()
+
+# faces of every possible roll of n dice, by n, indexed as in _OUTCOMES
+_ROLLS = {
+    count: tuple(product(_DIE_FACES, repeat=count)) for count in range(2, 6)
+}
+
+
+def _build_round_odds() -> Dict[
+    Tuple[int, int], Tuple[Tuple[float, int, int], ...]
+]:
+    """
+    Collapses the outcome table into the probability of each distinct
+    (attacker, defender) casualty pair, for each pairing of dice counts.
+    """
+    odds = {}
+    for dice, outcomes in _OUTCOMES.items():
+        total = len(outcomes)
+        odds[dice] = tuple(
+            (outcomes.count(casualties) / total, *casualties)
+            for casualties in sorted(set(outcomes))
+        )
+    return odds
+
 
-        for i in range(battles):
-            if attacker_sorted[i] > defender_sorted[i]:
-                self.defender_casualties += 1
-            else:  # Defender wins ties
-                self.attacker_casualties += 1
+# probability of each casualty pair in a round, by dice counts
+_ROUND_ODDS = _build_round_odds()
+
+# (attacker win probability, expected surviving attackers, expected
+# surviving defenders) of fights resolved so far, by army counts
+_FIGHT_ODDS: Dict[Tuple[int, int], Tuple[float, float, float]] = {}
+
+
+def _fight_odds(attackers: int, defenders: int) -> Tuple[float, float, float]:
+    """
+    Solves the fight as an absorbing Markov chain. Every round removes
+    armies, so the odds of a state only depend on states with fewer armies,
+    which are filled in first and kept for later fights.
+
+    :returns: Tuple of (attacker_win_probability, expected_attackers,
+             expected_defenders) once the fight is over
+    """
+    odds = _FIGHT_ODDS
+    key = (attackers, defenders)
+    if key in odds:
+        return odds[key]
+
+    for att in range(attackers + 1):
+        for dfn in range(defenders + 1):
+            if (att, dfn) in odds:
+                continue
+            if dfn == 0:
+                odds[(att, dfn)] = (1.0 if att > 0 else 0.0, float(att), 0.0)
+                continue
+            if att == 0:
+                odds[(att, dfn)] = (0.0, 0.0, float(dfn))
+                continue
+
+            attacker_count = _ATT_DICE[min(att, 4)]
+            defender_count = _DEF_DICE[min(dfn, 2)]
+            win = expected_attackers = expected_defenders = 0.0
+            for chance, att_cas, def_cas in _ROUND_ODDS[
+                (attacker_count, defender_count)
+            ]:
+                next_win, next_att, next_def = odds[
+                    (max(att - att_cas, 0), max(dfn - def_cas, 0))
+                ]
+                win += chance * next_win
+                expected_attackers += chance * next_att
+                expected_defenders += chance * next_def
+            odds[(att, dfn)] = (win, expected_attackers, expected_defenders)
+
+    return odds[key]
+
+
+def _resolve_fight(
+    attackers: int, defenders: int, randrange=random.randrange
+) -> Tuple[int, int, int]:
+    """
+    Fights rounds until one side is eliminated, drawing each round's
+    casualties from the outcome table.
+
+    :returns: Tuple of (surviving_attackers, surviving_defenders, rounds)
+    """
+    rounds = 0
+    while attackers > 0 and defenders > 0:
+        attacker_count = _ATT_DICE[min(attackers, 4)]
+        defender_count = _DEF_DICE[min(defenders, 2)]
+        outcomes = _OUTCOMES[(attacker_count, defender_count)]
+        attacker_casualties, defender_casualties = outcomes[randrange(len(outcomes))]
+        attackers -= attacker_casualties
+        defenders -= defender_casualties
+        rounds += 1
+    return attackers, defenders, rounds
+
+
+def simulate_fights(
+    attackers: int, defenders: int, samples: int, rng: random.Random = None
+) -> Tuple[int, float, float]:
+    """
+    Estimate the outcome of a fight by simulating it many times, without
+    creating a Fight for each sample.
+
+    :param attackers: Number of attacking armies
+    :param defenders: Number of defending armies
+    :param samples: Number of fights to simulate
+    :param rng: Random generator to draw rolls from, defaults to the
+                shared module generator
+    :returns: Tuple of (attacker_wins, mean_surviving_attackers,
+             mean_surviving_defenders) over the samples
+    """
+    randrange = random.randrange if rng is None else rng.randrange
+    wins = 0
+    surviving_attackers = 0
+    surviving_defenders = 0
+    for _ in range(samples):
+        att, dfn, _ = _resolve_fight(attackers, defenders, randrange)
+        if dfn == 0:
+            wins += 1
+        surviving_attackers += att
+        surviving_defenders += dfn
+
+    if samples <= 0:
+        return 0, 0.0, 0.0
+    return wins, surviving_attackers / samples, surviving_defenders / samples
+
+
+def _simulate_fights_seeded(
+    attackers: int, defenders: int, samples: int, seed: int
+) -> Tuple[int, float, float]:
+    """
+    Runs simulate_fights on its own seeded generator, so that each worker
+    of a batch draws an independent stream of rolls.
+    """
+    return simulate_fights(attackers, defenders, samples, random.Random(seed))
+
+
+def simulate_fight_batch(
+    attackers: int,
+    defenders: int,
+    samples: int,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Tuple[int, float, float]:
+    """
+    Estimate the outcome of a fight like simulate_fights, but split the
+    samples across worker processes. Each worker is seeded from the module
+    generator, so seeding it beforehand reproduces the batch.
+
+    :param attackers: Number of attacking armies
+    :param defenders: Number of defending armies
+    :param samples: Number of fights to simulate
+    :param workers: Number of processes to use, defaults to the cpu count
+    :param executor: Executor to run the workers on, defaults to a process
+                     pool started for this batch
+    :returns: Tuple of (attacker_wins, mean_surviving_attackers,
+             mean_surviving_defenders) over all samples
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, samples))
+    if workers == 1:
+        return simulate_fights(attackers, defenders, samples)
+
+    shares = [samples // workers] * workers
+    for i in range(samples % workers):
+        shares[i] += 1
+    seeds = [random.getrandbits(64) for _ in range(workers)]
+    arguments = ([attackers] * workers, [defenders] * workers, shares, seeds)
+
+    if executor is not None:
+        results = list(executor.map(_simulate_fights_seeded, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_fights_seeded, *arguments))
+
+    # merge the per worker means, weighted by their share of the samples
+    wins = sum(result[0] for result in results)
+    surviving_attackers = sum(
+        result[1] * share for result, share in zip(results, shares)
+    )
+    surviving_defenders = sum(
+        result[2] * share for result, share in zip(results, shares)
+    )
+    return wins, surviving_attackers / samples, surviving_defenders / samples
 
 
 @dataclass
@@ -90,12 +393,21 @@ class Fight:
     rounds_fought: int = 0
     total_attacker_casualties: int = 0
     total_defender_casualties: int = 0
-    dice_history: List[DiceRoll] = field(default_factory=list)
+    dice_history: Optional[List[DiceRoll]] = None
+    # when False the dice of each round are not kept, and dice_history
+    # stays None
+    record_history: bool = True
+    # random number generator the dice are drawn from
+    rng: random.Random = field(default=random, repr=False, compare=False)
+    # result recorded when the fight is completed by its own rounds
+    _result: Optional[FightResult] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize current army counts after object creation."""
         self.current_attackers = self.initial_attackers
         self.current_defenders = self.initial_defenders
+        if self.record_history and self.dice_history is None:
+            self.dice_history = []
 
     def get_dice_count(self, is_attacker: bool) -> int:
         """
@@ -107,18 +419,9 @@ class Fight:
         """
         if is_attacker:
             # Attacker can roll 1-3 dice based on army count
-            if self.current_attackers >= 4:
-                return 3
-            elif self.current_attackers >= 3:
-                return 2
-            else:
-                return 1
-        else:
-            # Defender can roll 1-2 dice based on army count
-            if self.current_defenders >= 2:
-                return 2
-            else:
-                return 1
+            return _ATT_DICE[min(max(self.current_attackers, 1), 4)]
+        # Defender can roll 1-2 dice based on army count
+        return _DEF_DICE[min(max(self.current_defenders, 1), 2)]
 
     def roll_dice(self) -> List[int]:
         """
@@ -126,7 +429,7 @@ class Fight:
 
         :returns: List of dice values in random order
         """
-        return [random.randint(1, 6)]
+        return [self.rng.randint(1, 6)]
 
     def fight_round(self) -> DiceRoll:
         """
@@ -140,15 +443,22 @@ class Fight:
             raise ValueError("Fight cannot continue - insufficient armies")
 
         # Determine dice counts
-        attacker_dice_count = self.get_dice_count(is_attacker=True)
-        defender_dice_count = self.get_dice_count(is_attacker=False)
-
-        # Roll dice for both sides
-        attacker_dice = [random.randint(1, 6) for _ in range(attacker_dice_count)]
-        defender_dice = [random.randint(1, 6) for _ in range(defender_dice_count)]
-
-        # Create dice roll result and calculate casualties
-        dice_roll = DiceRoll(attacker_dice=attacker_dice, defender_dice=defender_dice)
+        attacker_dice_count = _ATT_DICE[min(self.current_attackers, 4)]
+        defender_dice_count = _DEF_DICE[min(self.current_defenders, 2)]
+
+        # Roll dice for both sides in a single draw, which indexes every
+        # possible roll and its casualties
+        rolls = _ROLLS[attacker_dice_count + defender_dice_count]
+        roll = self.rng.randrange(len(rolls))
+        dice = rolls[roll]
+        attacker_dice = dice[:attacker_dice_count]
+        defender_dice = dice[attacker_dice_count:]
+        attacker_casualties, defender_casualties = _OUTCOMES[
+            (attacker_dice_count, defender_dice_count)
+        ][roll]
+        dice_roll = DiceRoll(
+            attacker_dice, defender_dice, attacker_casualties, defender_casualties
+        )
 
         # Apply casualties
         self.current_attackers -= dice_roll.attacker_casualties
@@ -158,14 +468,26 @@ class Fight:
 
         # Update fight state
         self.rounds_fought += 1
-        self.dice_history.append(dice_roll)
+        if self.record_history:
+            self.dice_history.append(dice_roll)
 
         # Check if fight is complete
         if not self.can_continue():
-            self.phase = FightPhase.COMPLETED
+            self._complete()
 
         return dice_roll
 
+    def _complete(self) -> None:
+        """
+        Mark the fight as completed and record its result, so that later
+        queries do not need to work out the winner again.
+        """
+        self.phase = FightPhase.COMPLETED
+        if self.current_defenders == 0:
+            self._result = FightResult.ATTACKER_WINS
+        elif self.current_attackers == 0:
+            self._result = FightResult.DEFENDER_WINS
+
     def can_continue(self) -> bool:
         """
         Check if the fight can continue. Requires both attackers and
@@ -205,6 +527,8 @@ class Fight:
         """
         if self.phase == FightPhase.ACTIVE:
             return FightResult.ONGOING
+        if self._result is not None:
+            return self._result
 
         winner = self.get_winner()
         if winner == "attacker":
@@ -244,6 +568,64 @@ class Fight:
 
         return self.get_result()
 
+    def fight_n_rounds(self, rounds: int) -> FightResult:
+        """
+        Execute at most the given number of rounds, stopping early if one
+        side is eliminated. The fight can be continued afterwards.
+
+        :param rounds: Maximum number of rounds to fight
+        :returns: Result of the fight after these rounds, ONGOING if
+                 neither side has been eliminated
+        """
+        for _ in range(rounds):
+            if not self.can_continue():
+                break
+            self.fight_round()
+
+        return self.get_result()
+
+    def fight_to_completion_analytic(self) -> Tuple[float, float, float]:
+        """
+        Work out the odds of the fight from its current armies without
+        rolling any dice. The fight itself is left unchanged.
+
+        :returns: Tuple of (attacker_win_probability,
+                 expected_surviving_attackers, expected_surviving_defenders)
+        """
+        return _fight_odds(
+            max(self.current_attackers, 0), max(self.current_defenders, 0)
+        )
+
+    def fight_to_completion_fast(self) -> FightResult:
+        """
+        Execute the entire fight until completion, without recording the
+        dice rolled in each round. Rounds are resolved on local counts and
+        the fight is only updated once, so this suits callers that need
+        the outcome and casualties but not the dice history.
+
+        :returns: Final result of the completed fight
+        :raises ValueError: When the fight records its dice history
+        """
+        if self.record_history:
+            raise ValueError(
+                "Fight records its dice history - use fight_to_completion"
+            )
+        if self.phase != FightPhase.ACTIVE:
+            return self.get_result()
+
+        attackers, defenders, rounds = _resolve_fight(
+            self.current_attackers, self.current_defenders, self.rng.randrange
+        )
+
+        self.total_attacker_casualties += self.current_attackers - attackers
+        self.total_defender_casualties += self.current_defenders - defenders
+        self.current_attackers = attackers
+        self.current_defenders = defenders
+        self.rounds_fought += rounds
+        self._complete()
+
+        return self.get_result()
+
     def is_completed(self) -> bool:
         """
         Check if the fight has been completed. Fight is complete when one
@@ -264,7 +646,9 @@ class Fight:
         casualties_att, casualties_def = self.get_casualties()
 
         rounds = ""
-        for i, dice_roll in enumerate(self.dice_history):
+        if not self.record_history:
+            rounds = f" {self.rounds_fought} rounds fought, dice not recorded.\n"
+        for i, dice_roll in enumerate(self.dice_history or ()):
             rounds += (
                 f" Round {i+1}: "
                 f"Attacker rolled {dice_roll.attacker_dice} "
@@ -3,20 +3,25 @@ Core game state classes for the Risk simulation.
 Manages players, game state, and overall simulation state.
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left, insort
+from dataclasses import InitVar, dataclass, field, fields
 import random
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Set, Tuple
 from enum import Enum
 import time
+import weakref
 
-from .territory import Territory
-from .ui import TurnUI
+from .territory import Territory, TerritoryState
 from .turn_manager import TurnManager
 from risk.utils.map import Graph, Node, Edge, construct_graph
 from risk.utils.logging import info
 
+if TYPE_CHECKING:
+    # the turn UI pulls in pygame, so it is only loaded once a game starts
+    from .ui import TurnUI
 
-@dataclass
+
+@dataclass(slots=True)
 class UIState:
     selected_territory_id: Optional[int] = None
 
@@ -38,7 +43,45 @@ class GamePhase(Enum):
         return f"GamePhase.{self.name}"
 
 
-@dataclass
+# colours handed out to players in seat order, wrapping around
+_PLAYER_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    (200, 50, 50),  # Red
+    (50, 200, 50),  # Green
+    (50, 50, 200),  # Blue
+    (200, 200, 50),  # Yellow
+    (200, 50, 200),  # Magenta
+    (50, 200, 200),  # Cyan
+    (150, 75, 0),  # Brown
+    (255, 165, 0),  # Orange
+)
+
+# fields left out of reprs and pickles, as they are rebuilt from the rest
+_DERIVED_FIELDS = frozenset(
+    (
+        "ui_state",
+        "ui_turn_manager",
+        "ui_turn_state",
+        "_stats_dirty",
+        "_rng",
+        "_by_owner",
+        "_all_territories_mask",
+        "_reinforcement_table",
+        "_wall_dirty",
+    )
+)
+
+
+def _unfile_territory(
+    index: Dict[Optional[int], List[int]], key: Optional[int], territory_id: int
+) -> None:
+    """Remove a territory id from under a key of an owner index, if filed."""
+    filed = index.get(key, [])
+    at = bisect_left(filed, territory_id)
+    if at < len(filed) and filed[at] == territory_id:
+        del filed[at]
+
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game."""
 
@@ -49,19 +92,62 @@ class Player:
     is_human: bool = False  # False for AI agents
 
     # Game statistics
-    territories_controlled: Set[int] = field(default_factory=set)
+    territories_mask: int = 0  # bit i is set when territory i is controlled
+    # ids of controlled territories, as accepted before the mask was kept
+    territories_controlled: InitVar[Optional[Set[int]]] = None
     total_armies: int = 0
     reinforcements_available: int = 0
     runtime: float = 0.0  # Total runtime of the agent
 
+    def __post_init__(self, territories_controlled: Optional[Set[int]]) -> None:
+        """Seed the territories mask from a set of controlled ids."""
+        if territories_controlled is not None:
+            self._set_territories_controlled(territories_controlled)
+
+    def _get_territories_controlled(self) -> FrozenSet[int]:
+        """
+        The ids of the territories controlled by this player, built from
+        the territories mask. The set is frozen, as changes to it would not
+        be kept; assign a new set instead.
+        """
+        mask = self.territories_mask
+        controlled = []
+        while mask:
+            low = mask & -mask
+            controlled.append(low.bit_length() - 1)
+            mask ^= low
+        return frozenset(controlled)
+
+    def _set_territories_controlled(self, territory_ids: Set[int]) -> None:
+        mask = 0
+        for territory_id in territory_ids:
+            mask |= 1 << territory_id
+        self.territories_mask = mask
+
+    def add_territory(self, territory_id: int) -> None:
+        """
+        Mark a territory as controlled by this player.
+
+        :param territory_id: ID of the territory gained
+        """
+        self.territories_mask |= 1 << territory_id
+
+    def remove_territory(self, territory_id: int) -> None:
+        """
+        Mark a territory as no longer controlled by this player.
+
+        :param territory_id: ID of the territory lost
+        """
+        self.territories_mask &= ~(1 << territory_id)
+
     def get_territory_count(self) -> int:
         """
         Get the number of territories controlled by this player. Returns the
-        size of the controlled territories set.
+        number of bits set in the territories mask.
 
         :returns: Number of territories controlled by this player
         """
-        return len(self.territories_controlled)
+        return self.territories_mask.bit_count()
 
     def is_eliminated(self) -> bool:
         """
@@ -71,14 +157,25 @@ class Player:
         :returns: True if player controls no territories and is eliminated,
                  False otherwise
         """
-        return len(self.territories_controlled) == 0
+        return self.territories_mask == 0
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        ret = "Player("
-        for attr, value in self.__dict__.items():
-            ret += f"\n\t{attr}={repr(value)},"
-        return ret + ")"
+        attrs = "".join(
+            f"\n\t{attr.name}={getattr(self, attr.name)!r},"
+            for attr in fields(self)
+            if attr.repr
+        )
+        return f"Player({attrs})"
+
+
+# set up after the class, so that the dataclass keeps the init argument of
+# the same name rather than taking this property as its default
+Player.territories_controlled = property(
+    Player._get_territories_controlled,
+    Player._set_territories_controlled,
+    doc=Player._get_territories_controlled.__doc__,
+)
 
 
 @dataclass
@@ -111,6 +208,8 @@ class GameState:
     # Timing and metadata
     created_at: float = field(default_factory=time.time)
     last_updated: float = field(default_factory=time.time)
+    version: int = 0  # incremented on every mutation
+    seed: Optional[int] = None  # seeds this game's random number generator
 
     # rendering
     screen_width: int = 1800
@@ -119,7 +218,58 @@ class GameState:
     # UI state
     ui_state: UIState = field(default_factory=UIState)
     ui_turn_manager: TurnManager = field(default_factory=lambda: None)
-    ui_turn_state: TurnUI = field(default_factory=lambda: None)
+    ui_turn_state: "TurnUI" = field(default_factory=lambda: None)
+
+    # set when ownership or armies change without refreshing statistics
+    _stats_dirty: bool = field(default=False, init=False, repr=False)
+    # set when last_updated is behind version, and read on demand
+    _wall_dirty: bool = field(default=False, init=False, repr=False)
+    # bit i is set for each territory i on the board
+    _all_territories_mask: int = field(default=0, init=False, repr=False)
+    # reinforcements for each territory count up to the number of regions
+    _reinforcement_table: Tuple[int, ...] = field(
+        default=(), init=False, repr=False
+    )
+    # ids of territories by owner in id order, with None for the free ones
+    _by_owner: Dict[Optional[int], List[int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # random number generator owned by this game, set up by get_rng
+    _rng: Optional[random.Random] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        """Index the territories the game state was created with."""
+        self._reinforcement_table = tuple(
+            max(3, count // 3) for count in range(self.regions + 1)
+        )
+        for territory in self.territories.values():
+            self._index_territory(territory)
+
+    def _index_territory(self, territory: Territory) -> None:
+        """
+        File a territory under its owner, and give it a weak reference to
+        this game state so that its ownership changes reach the index.
+        """
+        territory._game_state = weakref.ref(self)
+        insort(self._by_owner.setdefault(territory.index_key(), []), territory.id)
+
+    def _set_territory_owner(
+        self,
+        territory_id: int,
+        previous_owner_id: Optional[int],
+        owner_id: Optional[int],
+    ) -> None:
+        """
+        Move a territory between owners in the owner index, with None
+        standing for free territories. Called by the territory when its
+        owner changes.
+
+        :param territory_id: ID of the territory that changed hands
+        :param previous_owner_id: Owner it was filed under, None if free
+        :param owner_id: Owner to file it under, None if free
+        """
+        _unfile_territory(self._by_owner, previous_owner_id, territory_id)
+        insort(self._by_owner.setdefault(owner_id, []), territory_id)
 
     @classmethod
     def create_new_game(
@@ -140,22 +290,11 @@ class GameState:
         )
 
         # Initialize players
-        player_colors = [
-            (200, 50, 50),  # Red
-            (50, 200, 50),  # Green
-            (50, 50, 200),  # Blue
-            (200, 200, 50),  # Yellow
-            (200, 50, 200),  # Magenta
-            (50, 200, 200),  # Cyan
-            (150, 75, 0),  # Brown
-            (255, 165, 0),  # Orange
-        ]
-
         for i in range(num_players):
             player = Player(
                 id=i,
                 name=f"Player {i + 1}",
-                color=player_colors[i % len(player_colors)],
+                color=_PLAYER_COLORS[i % len(_PLAYER_COLORS)],
             )
             game_state.players[i] = player
 
@@ -166,27 +305,60 @@ class GameState:
         Determine and set adjacent territories based on shared vertices.
         Updates each territory's adjacency list.
         """
-        from risk.utils.distance import euclidean_distance
-        from risk.utils.distance import Point
-        from itertools import product
+        from math import floor
 
         espilson = 1e-4  # small value to avoid floating point issues
+        limit = espilson * espilson
+
+        # bucket vertices into cells as wide as espilson, so only vertices
+        # in the same or a neighbouring cell can be shared
+        buckets: Dict[Tuple[int, int], List[Tuple[float, float, int]]] = {}
         for territory in self.territories.values():
-            for other in self.territories.values():
-                if other.id == territory.id:
-                    continue
-                shared_vertices = any(
-                    euclidean_distance(Point(*l), Point(*r)) < espilson
-                    for l, r in product(territory.vertices, other.vertices)
-                )
-                if shared_vertices:
-                    territory.add_adjacent_territory(other)
-                    other.add_adjacent_territory(territory)
+            for x, y in territory.vertices:
+                cell = (floor(x / espilson), floor(y / espilson))
+                buckets.setdefault(cell, []).append((x, y, territory.id))
+
+        # each cell is compared with itself and the neighbours ahead of it,
+        # so every pair of neighbouring cells is only visited once
+        ahead = ((1, -1), (1, 0), (1, 1), (0, 1))
+        pairs: Set[Tuple[int, int]] = set()
+        for (cell_x, cell_y), members in buckets.items():
+            neighbours = [members]
+            for step_x, step_y in ahead:
+                others = buckets.get((cell_x + step_x, cell_y + step_y))
+                if others:
+                    neighbours.append(others)
+            for x, y, territory_id in members:
+                for others in neighbours:
+                    for other_x, other_y, other_id in others:
+                        if other_id == territory_id:
+                            continue
+                        dx = x - other_x
+                        dy = y - other_y
+                        if dx * dx + dy * dy < limit:
+                            if territory_id < other_id:
+                                pairs.add((territory_id, other_id))
+                            else:
+                                pairs.add((other_id, territory_id))
+
+        territories = self.territories
+        for territory_id, other_id in pairs:
+            territory = territories[territory_id]
+            other = territories[other_id]
+            territory.add_adjacent_territory(other)
+            other.add_adjacent_territory(territory)
 
     def initialise(self, generate_board: bool = True) -> None:
         """
         Set up initial game state.
         """
+        # restart the random number generator for a new board, so a seeded
+        # game is repeated, while a copied or loaded game carries on with
+        # the generator it has
+        if generate_board:
+            self._rng = None
+        rng = self.get_rng()
+
         # set territories
         if not self.territories or generate_board:
             from ..state.board_generator import generate_sample_board
@@ -199,10 +371,12 @@ class GameState:
 
         if self.current_player_id is None:
             # set first player
-            self.current_player_id = random.choice(list(self.players.keys()))
+            self.current_player_id = rng.choice(list(self.players))
             self.starting_player = self.current_player_id
 
         self.ui_turn_manager = TurnManager(self)
+        from .ui import TurnUI
+
         self.ui_turn_state = TurnUI(self.screen_width, self.screen_height)
 
         self.update_player_statistics()
@@ -220,18 +394,41 @@ class GameState:
         :returns:
             the number of reinforcements
         """
-        territory_count = self.get_player(player_id).get_territory_count()
+        self.refresh_player_statistics()
+        territory_count = self.players[player_id].territories_mask.bit_count()
+        table = self._reinforcement_table
+        if territory_count < len(table):
+            return table[territory_count]
         return max(3, territory_count // 3)
 
     def add_territory(self, territory: Territory) -> None:
         """
         Add a territory to the game state. Updates the territories
-        dictionary and timestamps.
+        dictionary and version.
 
         :param territory: Territory object to add to the game state
         """
+        replaced = self.territories.get(territory.id)
+        if replaced is not None:
+            _unfile_territory(self._by_owner, replaced.index_key(), replaced.id)
+            replaced._game_state = None
         self.territories[territory.id] = territory
-        self.last_updated = time.time()
+        self._index_territory(territory)
+        self._all_territories_mask |= 1 << territory.id
+        self._mark_updated()
+
+    def get_rng(self) -> random.Random:
+        """
+        Get the random number generator of this game, used for the board,
+        the starting player and the fights. Each game draws from its own
+        generator, seeded with the game's seed, or from the system when the
+        game has no seed.
+
+        :returns: Random number generator of this game
+        """
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
 
     def get_territory(self, territory_id: int) -> Optional[Territory]:
         """
@@ -260,6 +457,7 @@ class GameState:
 
         :returns: List of active players who are still in the game
         """
+        self.refresh_player_statistics()
         return [
             player
             for player in self.players.values()
@@ -274,12 +472,32 @@ class GameState:
         :param player_id: ID of the player whose territories to retrieve
         :returns: List of territories owned by the specified player
         """
+        if player_id is None:
+            return []
+        territories = self.territories
         return [
-            territory
-            for territory in self.territories.values()
-            if territory.is_owned_by(player_id)
+            territories[territory_id]
+            for territory_id in self._by_owner.get(player_id, ())
         ]
 
+    def get_attacking_territories(self, player_id: int) -> List[Territory]:
+        """
+        Get the territories a player can launch attacks from. Only the
+        player's own territories are visited, by way of the owner index.
+
+        :param player_id: ID of the player whose attackers to retrieve
+        :returns: List of the player's territories with more than 1 army
+        """
+        if player_id is None:
+            return []
+        territories = self.territories
+        attackers = []
+        for territory_id in self._by_owner.get(player_id, ()):
+            territory = territories[territory_id]
+            if territory.armies > 1 and territory.state is TerritoryState.OWNED:
+                attackers.append(territory)
+        return attackers
+
     def get_free_territories(self) -> List[Territory]:
         """
         Get all unowned territories. Filters territories that are currently
@@ -287,8 +505,10 @@ class GameState:
 
         :returns: List of free territories that have no current owner
         """
+        territories = self.territories
         return [
-            territory for territory in self.territories.values() if territory.is_free()
+            territories[territory_id]
+            for territory_id in self._by_owner.get(None, ())
         ]
 
     def advance_turn(self) -> None:
@@ -296,25 +516,34 @@ class GameState:
         Advance to the next player's turn. Cycles through active players
         and increments turn counter.
         """
-        # Get all players who are still active (not eliminated)
-        active_players = [p for p in self.players.values() if p.is_active]
+        self.refresh_player_statistics()
+        # Stop once a second active player is found, as the turn only
+        # needs to move on when more than one player remains
+        active_players = 0
+        for player in self.players.values():
+            if player.is_active:
+                active_players += 1
+                if active_players > 1:
+                    break
 
-        if len(active_players) <= 1:
+        if active_players <= 1:
             return
 
-        next_id = (self.current_player_id + 1) % len(self.players.keys())
-        self.current_player_id = next_id
+        # player ids are their seats, so the current id is the turn cursor,
+        # stepped past inactive seats until an active player is reached
+        players = self.players
+        seats = len(players)
+        while True:
+            self.current_player_id = (self.current_player_id + 1) % seats
 
-        if self.current_player_id == self.starting_player:
-            self.total_turns += 1
-            self.current_turn += 1
+            if self.current_player_id == self.starting_player:
+                self.total_turns += 1
+                self.current_turn += 1
 
-        next_player = self.get_player(self.current_player_id)
-        if not next_player.is_active:
-            return self.advance_turn()
+            if players[self.current_player_id].is_active:
+                break
 
-        self.last_updated = time.time()
-        return
+        self._mark_updated()
 
     def check_victory_condition(self) -> Optional[int]:
         """
@@ -324,41 +553,92 @@ class GameState:
         :returns: ID of winning player, or None if no winner yet
         """
         active_players = self.get_active_players()
-
         if len(active_players) == 1:
-            self.winner_id = active_players[0].id
-            self.phase = GamePhase.GAME_END
-            return self.winner_id
-
-        # Check if any player controls all territories
-        for player in active_players:
-            if player.get_territory_count() == len(self.territories):
-                self.winner_id = player.id
-                self.phase = GamePhase.GAME_END
-                return player.id
-
-        return None
+            winner = active_players[0]
+        else:
+            # Check if any player controls all territories
+            all_territories = self._all_territories_mask
+            for winner in active_players:
+                if winner.territories_mask == all_territories:
+                    break
+            else:
+                return None
+
+        self.winner_id = winner.id
+        self.phase = GamePhase.GAME_END
+        return self.winner_id
 
     def update_player_statistics(self) -> None:
         """
         Update all player statistics based on current territory ownership.
         Recalculates territory counts and armies for all players.
         """
-        # Reset all player territory sets
-        for player in self.players.values():
-            terrs = self.get_territories_owned_by(player.id)
-            player.territories_controlled = set([t.id for t in terrs])
+        self._stats_dirty = False
 
-            player.total_armies = sum(t.armies for t in terrs)
+        # Tally territories and armies per owner in one pass, like a
+        # bincount, then write each player's statistics once
+        players = self.players
+        masks = dict.fromkeys(players, 0)
+        armies = dict.fromkeys(players, 0)
 
-        # Check for eliminated players
-        for player in self.players.values():
-            if player.is_eliminated() and player.is_active:
+        free = TerritoryState.FREE
+        all_territories = 0
+        for territory in self.territories.values():
+            bit = 1 << territory.id
+            all_territories |= bit
+            owner = territory.owner
+            if territory.state is free or owner not in masks:
+                continue
+            masks[owner] |= bit
+            armies[owner] += territory.armies
+        self._all_territories_mask = all_territories
+
+        for player_id, player in players.items():
+            player.territories_mask = masks[player_id]
+            player.total_armies = armies[player_id]
+            # Check for eliminated players
+            if player.is_active and not player.territories_mask:
                 player.is_active = False
 
-        self.last_updated = time.time()
+        self._mark_updated()
         self.map = construct_graph(self)
 
+    def _mark_updated(self) -> None:
+        """
+        Record a mutation by bumping the version. The wall clock is only
+        read when last_updated is next asked for.
+        """
+        self.version += 1
+        self._wall_dirty = True
+
+    def get_last_updated(self) -> float:
+        """
+        Get the time of the last update, reading the wall clock once if
+        the state has changed since it was last asked for.
+
+        :returns: Timestamp of the last update
+        """
+        if self._wall_dirty:
+            self.last_updated = time.time()
+            self._wall_dirty = False
+        return self.last_updated
+
+    def mark_statistics_dirty(self) -> None:
+        """
+        Flag that territory ownership or armies have changed without the
+        player statistics being recalculated. The statistics are then
+        recalculated once, when they are next needed.
+        """
+        self._stats_dirty = True
+
+    def refresh_player_statistics(self) -> None:
+        """
+        Recalculate player statistics only if they have been flagged as
+        out of date since the last update.
+        """
+        if self._stats_dirty:
+            self.update_player_statistics()
+
     def get_game_summary(self) -> Dict:
         """
         Get a summary of the current game state. Provides key information
@@ -375,20 +655,45 @@ class GameState:
             "winner": self.winner_id,
             "active_players": len(self.get_active_players()),
             "total_territories": len(self.territories),
-            "free_territories": len(self.get_free_territories()),
+            "free_territories": len(self._by_owner.get(None, ())),
             "created_at": self.created_at,
-            "last_updated": self.last_updated,
+            "last_updated": self.get_last_updated(),
         }
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        ret = "GameState("
+        self.get_last_updated()
+        self.refresh_player_statistics()
 
-        non_inserted = ["ui_state", "ui_turn_manager", "ui_turn_state"]
+        attrs = "".join(
+            f"\n\t{attr}={value!r},"
+            for attr, value in self.__dict__.items()
+            if attr not in _DERIVED_FIELDS
+        )
+        return f"GameState({attrs})"
 
-        for attr, value in self.__dict__.items():
-            if attr in non_inserted:
-                continue
-            ret += f"\n\t{attr}={repr(value)},"
+    def __getstate__(self) -> dict:
+        """
+        Pickle only the fields a game state is created with, as __repr__
+        does, leaving the UI and derived fields to be rebuilt. The random
+        number generator is kept, so a copy carries on drawing from where
+        the game is rather than from its seed.
+        """
+        self.get_last_updated()
+        self.refresh_player_statistics()
+        state = {
+            attr: value
+            for attr, value in self.__dict__.items()
+            if attr not in _DERIVED_FIELDS
+        }
+        if self._rng is not None:
+            state["_rng"] = self._rng
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild an unpickled game state through its constructor."""
+        state = dict(state)
+        rng = state.pop("_rng", None)
+        self.__init__(**state)
+        self._rng = rng
 
-        return ret + ")"
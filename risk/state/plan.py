@@ -3,6 +3,7 @@ This module introduces the concept of a plan and how it
 is represented on the simulation event stack.
 """
 
+from collections import deque
 from typing import Union
 
 from .game_state import GameState
@@ -13,8 +14,11 @@ class Goal:
     A goal to be achieved by the agent.
     """
 
+    __slots__ = ("description", "_hash")
+
     def __init__(self, description: str):
         self.description = description
+        self._hash = hash(description)
 
     def achieved(self, state: GameState, plan: "Plan") -> bool:
         """
@@ -29,7 +33,7 @@ class Goal:
         return f"Goal({repr(self.description)})"
 
     def __hash__(self):
-        return hash(self.description)
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, Goal):
@@ -43,16 +47,21 @@ class Plan:
     achieve a goal.
     """
 
+    __slots__ = ("name", "goal", "steps", "_hash")
+
     def __init__(self, name: str, goal: Goal):
         self.name = name
         self.goal = goal
-        self.steps = []
+        self.steps = deque()
+        # hash of the plan, dropped whenever its steps change
+        self._hash = None
 
     def add_step(self, step: "Step") -> "Plan":
         """
         Add a step to the plan.
         """
         self.steps.append(step)
+        self._hash = None
         return self
 
     def add_steps(self, steps: list["Step"]) -> "Plan":
@@ -60,6 +69,7 @@ class Plan:
         Add multiple steps to the plan.
         """
         self.steps.extend(steps)
+        self._hash = None
         return self
 
     def peek_step(self) -> Union[None, "Step"]:
@@ -74,8 +84,9 @@ class Plan:
         """
         Pop the next step off the plan.
         """
-        if len(self.steps) > 0:
-            return self.steps.pop(0)
+        if self.steps:
+            self._hash = None
+            return self.steps.popleft()
         return None
 
     def goal_achieved(self, state: GameState) -> bool:
@@ -98,11 +109,13 @@ class Plan:
 
     def __repr__(self) -> str:
         ret = f"Plan({repr(self.name)}, goal={repr(self.goal)})"
-        ret += f".add_steps({repr(self.steps)})"
+        ret += f".add_steps({repr(list(self.steps))})"
         return ret
 
     def __hash__(self):
-        return hash((self.name, self.goal, tuple(self.steps)))
+        if self._hash is None:
+            self._hash = hash((self.name, self.goal, tuple(self.steps)))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, Plan):
@@ -119,6 +132,8 @@ class Step:
     A single step in a plan.
     """
 
+    __slots__ = ("description",)
+
     def __init__(self, description: str):
         self.description = description
 
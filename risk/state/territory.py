@@ -3,12 +3,17 @@ Territory data structures for the Risk simulation.
 Defines Territory class with ownership states and adjacency tracking.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Set
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Tuple, Optional, Set
 from enum import Enum
+import sys
+import weakref
 
 from ..utils.distance import Point
 
+if TYPE_CHECKING:
+    from .game_state import GameState
+
 
 class TerritoryState(Enum):
     """
@@ -31,18 +36,23 @@ class TerritoryState(Enum):
         return f"{self.__class__.__name__}.{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Territory:
     """Represents a territory on the board with game state information.
 
     This class contains both the visual representation (polygon) and
     the game state (ownership, armies, adjacency) of a territory.
+
+    Ownership is changed through set_owner, set_contested and
+    resolve_contest, which keep the owner index of the game state holding
+    the territory up to date. Assigning owner or state directly bypasses
+    the index.
     """
 
     id: int
     name: str
     center: Tuple[int, int]  # (x, y) center position for rendering
-    vertices: List[Tuple[int, int]]  # Polygon vertices for rendering
+    vertices: Tuple[Tuple[float, float], ...]  # Polygon vertices for rendering
     continent: str = "Unknown"
 
     # Game state properties
@@ -53,22 +63,37 @@ class Territory:
 
     # Adjacency and connectivity
     adjacent_territories: Set["Territory"] = field(default_factory=set)
+    # bit i is set for each adjacent territory i, kept alongside for quick
+    # lookups and for combining with the players' territory masks
+    _adjacent_mask: int = field(default=0, init=False, repr=False)
+    # hash of the id, worked out once as territories live in many sets
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+    # weak reference to the game state holding this territory, told about
+    # ownership changes so that its owner index follows them
+    _game_state: Optional["weakref.ReferenceType[GameState]"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate territory state consistency after initialization."""
         # Ensure state consistency
-        if self.owner is not None and self.state == TerritoryState.FREE:
+        if self.owner is not None and self.state is TerritoryState.FREE:
             self.state = TerritoryState.OWNED
-        elif self.owner is None and self.state in (
-            TerritoryState.OWNED,
-            TerritoryState.CONTESTED,
-        ):
+        elif self.owner is None and self.state is not TerritoryState.FREE:
             self.state = TerritoryState.FREE
 
-        self.vertices = [
-            vert.to_tuple() if isinstance(vert, Point) else vert
+        # territories of a continent share a single name string
+        self.continent = sys.intern(self.continent)
+
+        # kept as a tuple of coordinate pairs, sized exactly to the polygon
+        self.vertices = tuple(
+            vert.to_tuple() if isinstance(vert, Point) else tuple(vert)
             for vert in self.vertices
-        ]
+        )
+        self._adjacent_mask = 0
+        for territory in self.adjacent_territories:
+            self._adjacent_mask |= 1 << territory.id
+        self._hash = hash(self.id)
 
     def add_adjacent_territory(self, territory: "Territory") -> None:
         """
@@ -78,6 +103,7 @@ class Territory:
         :param territory_id: ID of the adjacent territory to add
         """
         self.adjacent_territories.add(territory)
+        self._adjacent_mask |= 1 << territory.id
 
     def remove_adjacent_territory(self, territory: "Territory") -> None:
         """
@@ -87,6 +113,7 @@ class Territory:
         :param territory_id: ID of the territory to remove from adjacency
         """
         self.adjacent_territories.discard(territory)
+        self._adjacent_mask &= ~(1 << territory.id)
 
     def is_adjacent_to(self, territory_id: int) -> bool:
         """
@@ -96,7 +123,16 @@ class Territory:
         :param territory_id: ID of the territory to check adjacency with
         :returns: True if territories are adjacent, False otherwise
         """
-        return territory_id in [t.id for t in self.adjacent_territories]
+        return (self._adjacent_mask >> territory_id) & 1 == 1
+
+    def get_adjacent_mask(self) -> int:
+        """
+        Get the adjacent territories as a bitmask. Bit i is set when the
+        territory with id i is adjacent, so masks combine with | and &.
+
+        :returns: Bitmask of adjacent territory ids
+        """
+        return self._adjacent_mask
 
     def set_owner(self, player_id: Optional[int], army_count: int = 0) -> None:
         """
@@ -106,6 +142,7 @@ class Territory:
         :param player_id: ID of the owning player (None for free territory)
         :param army_count: Number of armies to place on the territory
         """
+        previous = self.index_key()
         self.owner = player_id
         self.armies = army_count
 
@@ -115,6 +152,22 @@ class Territory:
         else:
             self.state = TerritoryState.OWNED
 
+        if previous != player_id and self._game_state is not None:
+            game_state = self._game_state()
+            if game_state is not None:
+                game_state._set_territory_owner(self.id, previous, player_id)
+
+    def index_key(self) -> Optional[int]:
+        """
+        The key this territory is filed under in an owner index, which is
+        its owner, or None while it is free.
+
+        :returns: Owner ID, or None for a free territory
+        """
+        if self.state is TerritoryState.FREE:
+            return None
+        return self.owner
+
     def set_contested(self) -> None:
         """
         Mark this territory as contested (under attack). Changes state to
@@ -170,7 +223,7 @@ class Territory:
         """
         return (
             self.owner is not None
-            and self.state == TerritoryState.OWNED
+            and self.state is TerritoryState.OWNED
             and self.armies > 1
         )
 
@@ -191,7 +244,7 @@ class Territory:
 
         :returns: True if territory has no owner, False otherwise
         """
-        return self.state == TerritoryState.FREE
+        return self.state is TerritoryState.FREE
 
     def is_owned_by(self, player_id: int) -> bool:
         """
@@ -202,10 +255,8 @@ class Territory:
         :returns: True if territory is owned by the specified player, False
                  otherwise
         """
-        return self.owner == player_id and self.state in (
-            TerritoryState.OWNED,
-            TerritoryState.CONTESTED,
-        )
+        # a territory that is not free is either owned or contested
+        return self.owner == player_id and self.state is not TerritoryState.FREE
 
     def set_selected(self, selected: bool = True) -> None:
         """
@@ -226,23 +277,47 @@ class Territory:
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        ret = "Territory("
-        for key in vars(self):
+        parts = ["Territory("]
+        for key in (attr.name for attr in fields(self)):
             if key == "vertices":
-                ret += f"\n{key}=[\n"
+                parts.append(f"\n{key}=[\n")
                 last = 0
                 for next in range(1, len(self.vertices) + 6, 5):
-                    ret += "\t"
-                    for v in self.vertices[last:next]:
-                        ret += f"{repr(v)}, "
-                    ret += "\n"
+                    parts.append("\t")
+                    parts.extend(f"{v!r}, " for v in self.vertices[last:next])
+                    parts.append("\n")
                     last = next
-                ret += "], \n"
+                parts.append("], \n")
             elif key == "adjacent_territories":
-                ret += f"{key}={repr(set())}, "
+                parts.append(f"{key}={set()!r}, ")
+            elif key in ("_adjacent_mask", "_hash", "_game_state"):
+                continue
             else:
-                ret += f"{key}={repr(getattr(self, key))}, "
-        return ret + ")"
+                parts.append(f"{key}={getattr(self, key)!r}, ")
+        parts.append(")")
+        return "".join(parts)
+
+    def __reduce__(self):
+        """
+        Pickle a territory through its constructor, leaving out the
+        adjacencies as __repr__ does, so copies never rebuild sets that
+        hold territories before their hash is known.
+        """
+        return (
+            Territory,
+            (
+                self.id,
+                self.name,
+                self.center,
+                self.vertices,
+                self.continent,
+                self.state,
+                self.owner,
+                self.armies,
+                self.selected,
+            ),
+        )
 
     def __hash__(self):
-        return hash(self.id)
+        return self._hash
+
@@ -19,7 +19,7 @@ class TurnPhase(Enum):
     MOVING = "moving"  # Move troops between owned territories
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackState:
     """Represents the state of an ongoing attack."""
 
@@ -43,7 +43,7 @@ class AttackState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MovementState:
     """Represents the state of an ongoing troop movement."""
 
@@ -62,7 +62,7 @@ class MovementState:
         return self.moving_armies >= 1 and self.moving_armies <= self.max_moving_armies
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnState:
     """Manages the current state of a player's turn."""
 
@@ -106,7 +106,7 @@ class TurnState:
             return False
 
         # Check adjacency
-        if defender_territory not in attacker_territory.adjacent_territories:
+        if not attacker_territory.is_adjacent_to(defender_territory.id):
             return False
 
         self.current_attack = AttackState(
@@ -151,7 +151,7 @@ class TurnState:
             return False
 
         # Check adjacency
-        if target_territory not in source_territory.adjacent_territories:
+        if not source_territory.is_adjacent_to(target_territory.id):
             return False
 
         self.current_movement = MovementState(
@@ -237,6 +237,7 @@ class TurnManager:
         :param player_id: ID of player whose turn is starting
         :returns: True if turn started successfully, False if player invalid
         """
+        self.game_state.refresh_player_statistics()
         player = self.game_state.get_player(player_id)
         if not player or not player.is_active:
             return False
@@ -299,14 +300,12 @@ class TurnManager:
 
         :returns: True if current turn is complete and ready to end
         """
-        if not self.current_turn:
+        turn = self.current_turn
+        if not turn:
             return True
 
         # Turn is complete when in MOVING phase and no active actions
-        return (
-            self.current_turn.phase == TurnPhase.MOVING
-            and self.current_turn.current_movement is None
-        )
+        return turn.phase is TurnPhase.MOVING and turn.current_movement is None
 
     def can_advance_phase(self) -> bool:
         """
@@ -314,20 +313,22 @@ class TurnManager:
 
         :returns: True if phase can advance, False otherwise
         """
-        if not self.current_turn:
+        turn = self.current_turn
+        if not turn:
             return False
 
-        if self.current_turn.phase == TurnPhase.PLACEMENT:
+        phase = turn.phase
+        if phase is TurnPhase.PLACEMENT:
             # Can advance if all reinforcements placed
-            return self.current_turn.reinforcements_remaining == 0
+            return turn.reinforcements_remaining == 0
 
-        elif self.current_turn.phase == TurnPhase.ATTACKING:
+        elif phase is TurnPhase.ATTACKING:
             # Can always advance from attacking (end attacks)
             return True
 
-        elif self.current_turn.phase == TurnPhase.MOVING:
+        elif phase is TurnPhase.MOVING:
             # Can advance to end turn (if no active movement)
-            return self.current_turn.current_movement is None
+            return turn.current_movement is None
 
         return False
 
@@ -341,3 +342,30 @@ class TurnManager:
             return False
 
         return self.current_turn.advance_phase()
+
+    def legal_attacks(self, player_id: int) -> List[Tuple[int, int]]:
+        """
+        Find every attack the player could start, under the same rules as
+        TurnState.start_attack. Targets are found by masking each
+        attacker's adjacencies against the player's own territories.
+
+        :param player_id: ID of the player to find attacks for
+        :returns: List of (attacker_territory_id, defender_territory_id)
+                 pairs, ordered by attacker and then defender
+        """
+        owned_territories = self.game_state.get_territories_owned_by(player_id)
+        owned = 0
+        for territory in owned_territories:
+            owned |= 1 << territory.id
+
+        attacks = []
+        for territory in owned_territories:
+            if territory.armies <= 1:
+                continue
+            targets = territory.get_adjacent_mask() & ~owned
+            while targets:
+                # pop the lowest set bit, which is the next defender id
+                lowest = targets & -targets
+                attacks.append((territory.id, lowest.bit_length() - 1))
+                targets ^= lowest
+        return attacks
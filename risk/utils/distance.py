@@ -1,9 +1,10 @@
-from typing import Tuple, Literal, List 
+from typing import Callable, Tuple, Literal, List, Union
 from dataclasses import dataclass
 import random
 import math
+from bisect import bisect_right
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """
     Represents a 2D point with x and y coordinates. Used for geometric 
@@ -33,7 +34,9 @@ def euclidean_distance(point1: Point, point2: Point) -> float:
     :param point2: Second point for distance calculation
     :returns: Euclidean distance between the two points as a positive float
     """
-    return ((point1.x - point2.x) ** 2 + (point1.y - point2.y) ** 2) ** 0.5
+    dx = point1.x - point2.x
+    dy = point1.y - point2.y
+    return (dx * dx + dy * dy) ** 0.5
 
 def manhattan_distance(point1: Point, point2: Point) -> float:
     """
@@ -46,48 +49,136 @@ def manhattan_distance(point1: Point, point2: Point) -> float:
     """
     return abs(point1.x - point2.x) + abs(point1.y - point2.y)
 
+def euclidean_sq_xy(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Calculate the squared Euclidean distance between two coordinate pairs. 
+    Orders points the same as euclidean_distance without the square root.
+    
+    :param x1: X coordinate of the first point
+    :param y1: Y coordinate of the first point
+    :param x2: X coordinate of the second point
+    :param y2: Y coordinate of the second point
+    :returns: Squared Euclidean distance between the two points
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy
+
+def manhattan_xy(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Calculate the Manhattan distance between two coordinate pairs. 
+    
+    :param x1: X coordinate of the first point
+    :param y1: Y coordinate of the first point
+    :param x2: X coordinate of the second point
+    :param y2: Y coordinate of the second point
+    :returns: Manhattan distance between the two points
+    """
+    return abs(x1 - x2) + abs(y1 - y2)
+
 DISTANCE_METHODS = {
     'euclidean': euclidean_distance,
     'manhattan': manhattan_distance,
 }
 
+PointLike = Union[Point, Tuple[float, float]]
+
+def _target_xy(target: PointLike) -> Tuple[float, float]:
+    """Read the coordinates of a Point or an (x, y) tuple."""
+    if isinstance(target, Point):
+        return target.x, target.y
+    return target
+
+def _euclidean_key(
+        target: PointLike, 
+        points: List[PointLike]
+    ) -> Callable[[PointLike], float]:
+    """
+    Build a key ranking candidates by squared distance to the target, 
+    which keeps their euclidean order without the square root.
+    """
+    tx, ty = _target_xy(target)
+    if points and not isinstance(points[0], Point):
+        return lambda point: (point[0] - tx) ** 2 + (point[1] - ty) ** 2
+    return lambda point: (point.x - tx) ** 2 + (point.y - ty) ** 2
+
+def _manhattan_key(
+        target: PointLike, 
+        points: List[PointLike]
+    ) -> Callable[[PointLike], float]:
+    """Build a key ranking candidates by manhattan distance to the target."""
+    tx, ty = _target_xy(target)
+    if points and not isinstance(points[0], Point):
+        return lambda point: abs(point[0] - tx) + abs(point[1] - ty)
+    return lambda point: abs(point.x - tx) + abs(point.y - ty)
+
+def _make_finder(
+        pick: Callable[..., PointLike], 
+        ranking_key: Callable[..., Callable[[PointLike], float]]
+    ) -> Callable[[PointLike, List[PointLike]], PointLike]:
+    """
+    Build a point finder for one distance method, so that callers who know 
+    their method skip the dispatch on its name.
+    """
+    def finder(target: PointLike, points: List[PointLike]) -> PointLike:
+        return pick(points, key=ranking_key(target, points))
+    return finder
+
+find_closest_euclidean = _make_finder(min, _euclidean_key)
+find_closest_manhattan = _make_finder(min, _manhattan_key)
+find_farthest_euclidean = _make_finder(max, _euclidean_key)
+find_farthest_manhattan = _make_finder(max, _manhattan_key)
+
+_CLOSEST_FINDERS = {
+    'euclidean': find_closest_euclidean,
+    'manhattan': find_closest_manhattan,
+}
+_FARTHEST_FINDERS = {
+    'euclidean': find_farthest_euclidean,
+    'manhattan': find_farthest_manhattan,
+}
+
 def find_closest_point(
-        target: Point, 
-        points: List[Point], 
+        target: PointLike, 
+        points: List[PointLike], 
         method: Literal['euclidean', 'manhattan']
-    ) -> Point:
+    ) -> PointLike:
     """
     Find the closest point from a list to the target point. Uses the 
     specified distance method for comparison.
     
     :param target: Target point to find closest match for
-    :param points: List of candidate points to search through
+    :param points: List of candidate points, or (x, y) tuples, to search 
+                   through
     :param method: Distance calculation method ('euclidean' or 'manhattan')
     :returns: Point from the list that is closest to the target
-    :raises ValueError: When points list is empty
+    :raises ValueError: When points list is empty or the method is unknown
     """
-    closest_point = min(points, key=lambda point: DISTANCE_METHODS[method](
-        target, point))
-    return closest_point
+    finder = _CLOSEST_FINDERS.get(method)
+    if finder is None:
+        raise ValueError(f"Unknown distance method: {method}")
+    return finder(target, points)
 
 def find_farthest_point(
-        target: Point, 
-        points: List[Point], 
+        target: PointLike, 
+        points: List[PointLike], 
         method: Literal['euclidean', 'manhattan']
-    ) -> Point:
+    ) -> PointLike:
     """
     Find the farthest point from a list to the target point. Uses the 
     specified distance method for comparison.
     
     :param target: Target point to find farthest match from
-    :param points: List of candidate points to search through
+    :param points: List of candidate points, or (x, y) tuples, to search 
+                   through
     :param method: Distance calculation method ('euclidean' or 'manhattan')
     :returns: Point from the list that is farthest from the target
-    :raises ValueError: When points list is empty
+    :raises ValueError: When points list is empty or the method is unknown
     """
-    farthest_point = max(points, key=lambda point: DISTANCE_METHODS[method](
-        target, point))
-    return farthest_point
+    finder = _FARTHEST_FINDERS.get(method)
+    if finder is None:
+        raise ValueError(f"Unknown distance method: {method}")
+    return finder(target, points)
 
 def clean_sequence(vertices: List[Point]) -> List[Point]:
     """
@@ -102,16 +193,21 @@ def clean_sequence(vertices: List[Point]) -> List[Point]:
     if not vertices:
         return vertices
     
-    # Remove consecutive duplicates and
-    # super close points
-    keeping = [0, len(vertices) - 1]
-    for left,right in zip(range(len(vertices)), range(1, len(vertices))):
-        p1 = vertices[left]
-        p2 = vertices[right]
-        if euclidean_distance(p1, p2) > 1e-5:
-            keeping.append(right)
+    # Remove consecutive duplicates and super close points, comparing 
+    # squared distances so no square root is taken, while always keeping 
+    # the first and last vertex
+    min_gap_sq = 1e-5 * 1e-5
+    last = len(vertices) - 1
+    cleaned = [vertices[0]]
+    prev = vertices[0]
+    for index in range(1, last + 1):
+        point = vertices[index]
+        dx = prev.x - point.x
+        dy = prev.y - point.y
+        if index == last or dx * dx + dy * dy > min_gap_sq:
+            cleaned.append(point)
+        prev = point
 
-    cleaned = [ vertices[i] for i in sorted(set(keeping)) ]
     # Remove last vertex if it's the same as first
     if len(cleaned) > 1 and cleaned[0] == cleaned[-1]:
         cleaned.pop()
@@ -123,7 +219,8 @@ def random_walk(
         end: Point,
         num_steps: int = 5,
         variation_strength: float = 0.2,
-        clean: bool = True
+        clean: bool = True,
+        rng: random.Random = random,
     ) -> List[Point]:
     """
     Generate a random walk path between two points.
@@ -135,6 +232,8 @@ def random_walk(
                               line (0.0 = straight line, 1.0 = high variation)
     :param clean: Whether to clean the resulting sequence by removing 
                  duplicate/close vertices
+    :param rng: Random number generator to draw the variation from
+                (default the random module)
     :returns: List of points forming the random walk from start to end 
              (inclusive)
     """
@@ -157,44 +256,44 @@ def random_walk(
     # Maximum deviation distance
     max_deviation = path_length * variation_strength
     
+    uniform = rng.uniform
+    steps = num_steps + 1
+    correlation = 0.3
+    noise_strength = max_deviation * 0.1
+    start_x, start_y = start.x, start.y
+
     points = [start]
+    # base and varied position of the previous step, for the correlation
+    prev_base_x = prev_base_y = varied_x = varied_y = 0.0
     
     # Generate intermediate points with random walk
-    for i in range(1, num_steps + 1):
+    for i in range(1, steps):
         # Linear interpolation factor
-        t = i / (num_steps + 1)
+        t = i / steps
         
         # Base position along straight line
-        base_x = start.x + t * dx
-        base_y = start.y + t * dy
+        base_x = start_x + t * dx
+        base_y = start_y + t * dy
 
         # Random deviation perpendicular to the line
-        deviation = random.uniform(-max_deviation, max_deviation)
+        deviation = uniform(-max_deviation, max_deviation)
         
         # Add some brownian motion (correlation with previous step)
-        if len(points) > 1:
-            # Get previous deviation
-            prev_base_x = start.x + ((i-1) / (num_steps + 1)) * dx
-            prev_base_y = start.y + ((i-1) / (num_steps + 1)) * dy
-            prev_deviation_x = points[-1].x - prev_base_x
-            prev_deviation_y = points[-1].y - prev_base_y
-            prev_deviation = (prev_deviation_x * perp_x + 
-                              prev_deviation_y * perp_y)
-            
-            correlation = 0.3
+        if i > 1:
+            prev_deviation = ((varied_x - prev_base_x) * perp_x + 
+                              (varied_y - prev_base_y) * perp_y)
             deviation = (deviation * (1 - correlation) + 
                         prev_deviation * correlation)
         
-        # Apply perpendicular deviation
-        varied_x = base_x + deviation * perp_x
-        varied_y = base_y + deviation * perp_y
-        
-        # Add some additional small random noise
-        noise_strength = max_deviation * 0.1
-        varied_x += random.uniform(-noise_strength, noise_strength)
-        varied_y += random.uniform(-noise_strength, noise_strength)
+        # Apply perpendicular deviation, with some additional small 
+        # random noise
+        varied_x = (base_x + deviation * perp_x 
+                    + uniform(-noise_strength, noise_strength))
+        varied_y = (base_y + deviation * perp_y 
+                    + uniform(-noise_strength, noise_strength))
 
         points.append(Point(varied_x, varied_y))
+        prev_base_x, prev_base_y = base_x, base_y
 
     # Add end point
     points.append(end)
@@ -216,39 +315,80 @@ def point_in_polygon(point: Point,
                             vertices in order
     :returns: True if point is inside polygon, False otherwise
     """
+    return point_in_polygon_coords(point.x, point.y, polygon_vertices)
+
+
+def point_in_polygon_coords(x: float, y: float, 
+                           polygon_vertices: List[Tuple[float, float]]) -> bool:
+    """
+    Check if coordinates are inside a polygon using the ray casting 
+    algorithm. Holds the ray cast that point_in_polygon delegates to, so 
+    no Point is built for a hit test.
+    
+    :param x: X coordinate to test
+    :param y: Y coordinate to test
+    :param polygon_vertices: List of (x, y) tuples representing polygon 
+                            vertices in order
+    :returns: True if point is inside polygon, False otherwise
+    """
     if len(polygon_vertices) < 3:
         return False
     
-    x, y = point.x, point.y
-    n = len(polygon_vertices)
     inside = False
     
-    p1x, p1y = polygon_vertices[0]
-    for i in range(1, n + 1):
-        p2x, p2y = polygon_vertices[i % n]
-        
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
+    # walk the edges from the closing edge onwards, so each vertex is 
+    # unpacked once
+    p1x, p1y = polygon_vertices[-1]
+    for p2x, p2y in polygon_vertices:
+        # the edge straddles the ray when exactly one end is below y, 
+        # which also rules out horizontal edges
+        if (p1y < y) != (p2y < y) and x <= (p1x if p1x > p2x else p2x):
+            if (p1x == p2x 
+                    or x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x):
+                inside = not inside
         p1x, p1y = p2x, p2y
     
     return inside
 
 
-def point_in_polygon_coords(x: float, y: float, 
-                           polygon_vertices: List[Tuple[float, float]]) -> bool:
+def points_in_polygon(xs: List[float], ys: List[float], 
+                      polygon_vertices: List[Tuple[float, float]]
+    ) -> List[bool]:
     """
-    Check if coordinates are inside a polygon using the ray casting 
-    algorithm. Convenience wrapper for point_in_polygon.
+    Check many coordinates against one polygon using the ray casting 
+    algorithm. The edges are prepared once for the whole batch, rather 
+    than walked afresh for every point as point_in_polygon_coords does.
     
-    :param x: X coordinate to test
-    :param y: Y coordinate to test
+    :param xs: X coordinates to test
+    :param ys: Y coordinates to test, paired with xs
     :param polygon_vertices: List of (x, y) tuples representing polygon 
                             vertices in order
-    :returns: True if point is inside polygon, False otherwise
+    :returns: List with True for each point inside the polygon
     """
-    return point_in_polygon(Point(x, y), polygon_vertices)
+    if len(polygon_vertices) < 3:
+        return [False] * len(xs)
+
+    # points are sorted by y, so each edge only visits the points whose y 
+    # it straddles, found by bisecting its span; horizontal edges never 
+    # straddle the ray and are skipped
+    order = sorted(range(len(ys)), key=ys.__getitem__)
+    sorted_ys = [ys[i] for i in order]
+    inside = [False] * len(ys)
+    p1x, p1y = polygon_vertices[-1]
+    for p2x, p2y in polygon_vertices:
+        if p1y != p2y:
+            low, high = (p1y, p2y) if p1y < p2y else (p2y, p1y)
+            right = p1x if p1x > p2x else p2x
+            run = p2x - p1x
+            rise = p2y - p1y
+            for k in range(bisect_right(sorted_ys, low), 
+                           bisect_right(sorted_ys, high)):
+                i = order[k]
+                x = xs[i]
+                if x <= right and (
+                        run == 0 
+                        or x <= (sorted_ys[k] - p1y) * run / rise + p1x):
+                    inside[i] = not inside[i]
+        p1x, p1y = p2x, p2y
+
+    return inside
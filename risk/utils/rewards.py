@@ -12,6 +12,7 @@ def calculate_player_position_rewards(game_state: GameState) -> dict:
     Returns:
         dict: A dictionary mapping player IDs to their calculated rewards.
     """
+    game_state.refresh_player_statistics()
     total_territories = game_state.regions
     player_armies = [p.total_armies for p in game_state.players.values()]
     total_armies = sum(player_armies)
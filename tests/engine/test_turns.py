@@ -0,0 +1,68 @@
+from risk.engine.turns import RiskAttackEngine
+from risk.state.event_stack import CaptureTerritory, ResolveFightEvent
+from risk.state import GameState, Fight
+
+import random
+import unittest
+
+
+class TestRiskAttackEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(5, 2, 10)
+        self.state.initialise()
+        self.engine = RiskAttackEngine()
+
+        self.attacker = self.state.get_territory(0)
+        self.defender = self.state.get_territory(1)
+        self.attacker.set_owner(0, 31)
+        self.defender.set_owner(1, 3)
+        self.state.update_player_statistics()
+
+    def _resolve(self, attackers: int, defenders: int) -> ResolveFightEvent:
+        fight = Fight(
+            attacker_territory_id=self.attacker.id,
+            defender_territory_id=self.defender.id,
+            initial_attackers=attackers,
+            initial_defenders=defenders,
+            record_history=False,
+            rng=random.Random(7),
+        )
+        result = fight.fight_to_completion_fast()
+        atk_sur, def_sur = fight.get_surviving_armies()
+        return ResolveFightEvent(
+            self.attacker.id,
+            self.defender.id,
+            atk_sur,
+            def_sur,
+            fight,
+            result,
+            0,
+            0,
+        )
+
+    def test_revert_capture_restores_defender(self):
+        resolved = self._resolve(30, 3)
+        self.assertTrue(resolved.context.fight_result.attacker_won())
+
+        # apply the side effects in the order the stack pops them
+        pending = list(self.engine.process(self.state, resolved))
+        applied = []
+        while pending:
+            effect = pending.pop()
+            applied.append(effect)
+            pending.extend(effect.apply(self.state) or ())
+
+        self.assertEqual(self.defender.owner, 0)
+
+        for effect in reversed(applied):
+            effect.revert(self.state)
+            if isinstance(effect, CaptureTerritory):
+                self.assertEqual(effect.context.previous_armies, 3)
+                self.assertEqual(self.defender.owner, 1)
+                self.assertEqual(self.defender.armies, 3)
+
+        self.assertEqual(self.defender.owner, 1)
+        self.assertEqual(self.defender.armies, 3)
+        self.assertEqual(self.attacker.owner, 0)
+        self.assertEqual(self.attacker.armies, 31)
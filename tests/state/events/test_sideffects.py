@@ -0,0 +1,39 @@
+from risk.state.event_stack import CaptureTerritory, TransferArmies
+from risk.state import GameState
+
+import unittest
+
+
+class TestCaptureTerritory(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(5, 2, 10)
+        self.state.initialise()
+
+    def test_revert_restores_armies(self):
+        territory = self.state.get_territory(0)
+        owner = territory.owner
+        territory.armies = 3
+
+        capture = CaptureTerritory(territory.id, (owner + 1) % 2, owner, 3)
+
+        capture.apply(self.state)
+        self.assertEqual(territory.owner, (owner + 1) % 2)
+        self.assertEqual(territory.armies, 0)
+
+        capture.revert(self.state)
+        self.assertEqual(territory.owner, owner)
+        self.assertEqual(territory.armies, 3)
+
+
+class TestLazyDescriptions(unittest.TestCase):
+
+    def test_description_formatted_on_read(self):
+        effect = TransferArmies(3, 4, 5)
+        self.assertNotIn("name", effect.__dict__)
+
+        self.assertEqual(
+            effect.description, "Transfer Armies: Move 5 armies from 3 to 4"
+        )
+        self.assertEqual(effect, TransferArmies(3, 4, 5))
+        self.assertNotEqual(effect, TransferArmies(3, 4, 6))
@@ -29,6 +29,27 @@ class TestEvents(unittest.TestCase):
         self.assertTrue(ev4 != ev3)
         self.assertTrue(ev4.context.p1 == 1)
 
+    def test_fields(self):
+        ev = Event("attack", p1=1)
+
+        self.assertEqual(ev, Event("attack", {"p1": 1}))
+        self.assertEqual(ev.context.p1, 1)
+        self.assertEqual(eval(repr(ev)), ev)
+        with self.assertRaises(TypeError):
+            ev.context.p1 = 2
+
+    def test_tuple_context_with_fields(self):
+        from typing import NamedTuple
+
+        class Context(NamedTuple):
+            p1: int
+            p2: int
+
+        ev = Event("attack", Context(1, 2), p2=3, p3=4)
+
+        self.assertEqual(ev, Event("attack", {"p1": 1, "p2": 3, "p3": 4}))
+        self.assertEqual(ev.context.p2, 3)
+
     def test_str(self):
         ev = Event("attack")
         self.assertEqual(str(ev), "Event: attack, Context: {}")
@@ -131,6 +152,23 @@ class TestEventStack(unittest.TestCase):
         self.assertEqual(len(stack), 3)
         self.assertEqual(stack.peek(), ev3)
 
+    def test_extend(self):
+        elements = [Level("level 1"), Event("event 1"), Level("level 2")]
+
+        stack = EventStack("loop")
+        pushed = EventStack("loop")
+        stack.extend(elements)
+        for element in elements:
+            pushed.push(element)
+
+        self.assertEqual(len(stack), 3)
+        self.assertEqual(stack.depth, pushed.depth)
+        self.assertEqual(stack.current_level, pushed.current_level)
+
+        stack.pop()
+        self.assertEqual(stack.depth, 1)
+        self.assertEqual(stack.current_level, elements[0])
+
     def test_pop(self):
         ev = Event("event 1")
         ev2 = Event("event 2")
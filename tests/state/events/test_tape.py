@@ -0,0 +1,42 @@
+import unittest
+
+from risk.state.event_stack import Event, EventTape
+from risk.state.event_stack import PlacementPhase, PlacementPhaseEndEvent
+
+
+def shown_depths(tape):
+    """The depth of each element as indented by str, oldest first."""
+    lines = str(tape).splitlines()[1:]
+    return [
+        (len(line) - len(line.lstrip(" "))) // 2 for line in reversed(lines)
+    ]
+
+
+class TestEventTape(unittest.TestCase):
+
+    def setUp(self):
+        self.pairs = [(PlacementPhase, PlacementPhaseEndEvent)]
+        self.elements = [
+            Event("start"),
+            PlacementPhase(1, 0),
+            Event("placing"),
+            PlacementPhaseEndEvent(1, 0),
+            Event("end"),
+        ]
+
+    def test_depths(self):
+        tape = EventTape(self.pairs)
+        for element in self.elements:
+            tape.push(element)
+
+        self.assertEqual(len(tape), 5)
+        self.assertEqual(shown_depths(tape), [0, 0, 1, 0, 0])
+
+    def test_capacity(self):
+        tape = EventTape(self.pairs, capacity=3)
+        for element in self.elements:
+            tape.push(element)
+
+        self.assertEqual(len(tape), 3)
+        self.assertEqual(list(tape.stack), self.elements[2:])
+        self.assertEqual(shown_depths(tape), [1, 0, 0])
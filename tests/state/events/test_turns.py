@@ -1,5 +1,6 @@
 from risk.state.event_stack import PlacementPhase
 from risk.state.event_stack import TroopPlacementEvent, PlacementPhaseEndEvent
+from risk.state.event_stack import TroopPlacementBatch
 
 from risk.state.event_stack import AttackPhase
 from risk.state.event_stack import AttackOnTerritoryEvent, CasualtyEvent
@@ -8,7 +9,7 @@ from risk.state.event_stack import CaptureTerritoryEvent, AttackPhaseEndEvent
 from risk.state.event_stack import MovementPhase
 from risk.state.event_stack import MovementOfTroopsEvent, MovementPhaseEndEvent
 
-from risk.state.event_stack import EventStack, Level, Event
+from risk.state.event_stack import EventStack, Level, Event, phase_event
 from risk.state import Territory
 
 import unittest
@@ -69,6 +70,33 @@ class TestPlacementPhase(unittest.TestCase):
         # print()
         # print(str(self.stack))
 
+    def test_shared_phase(self):
+
+        phase = phase_event(PlacementPhase, self.turn, self.player)
+        self.assertIs(phase, phase_event(PlacementPhase, self.turn, self.player))
+        self.assertEqual(phase, PlacementPhase(self.turn, self.player))
+
+        ender = phase_event(PlacementPhaseEndEvent, self.turn, self.player)
+        self.assertEqual(ender, PlacementPhaseEndEvent(self.turn, self.player))
+        self.assertNotEqual(
+            ender, phase_event(PlacementPhaseEndEvent, self.turn + 1, self.player)
+        )
+
+    def test_batch(self):
+
+        batch = TroopPlacementBatch(self.turn, self.player)
+        for territory in [1, 2, 1, 1]:
+            batch.append(territory)
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(
+            batch.events(),
+            [
+                TroopPlacementEvent(self.turn, self.player, 1, 3),
+                TroopPlacementEvent(self.turn, self.player, 2, 1),
+            ],
+        )
+
     def test_engine(self):
         pass
 
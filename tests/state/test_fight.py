@@ -3,9 +3,20 @@ Unit tests for the fight system in Risk simulation.
 Tests dice-based combat mechanics, casualty calculations, and fight progression.
 """
 
+import random
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 from risk.state.fight import Fight, FightPhase, FightResult, DiceRoll
+from risk.state.fight import _OUTCOMES, simulate_fights, simulate_fight_batch
+
+
+def roll_index(faces):
+    """The single draw that rolls the given faces, read as base 6 digits."""
+    index = 0
+    for face in faces:
+        index = index * 6 + face - 1
+    return index
 
 
 class TestDiceRoll(unittest.TestCase):
@@ -57,6 +68,73 @@ class TestDiceRoll(unittest.TestCase):
         self.assertEqual(dice_roll.defender_casualties, 1)
 
 
+class TestOutcomeTable(unittest.TestCase):
+    """Test the precomputed casualties for every possible roll."""
+
+    def test_table_sizes(self):
+        """Test each pairing of dice counts covers every roll."""
+        for (attackers, defenders), outcomes in _OUTCOMES.items():
+            self.assertEqual(len(outcomes), 6 ** (attackers + defenders))
+
+    def test_three_vs_two_odds(self):
+        """Test the well known odds of a three versus two dice roll."""
+        outcomes = _OUTCOMES[(3, 2)]
+        self.assertEqual(outcomes.count((0, 2)), 2890)
+        self.assertEqual(outcomes.count((1, 1)), 2611)
+        self.assertEqual(outcomes.count((2, 0)), 2275)
+
+
+class TestSimulateFights(unittest.TestCase):
+    """Test the Monte Carlo estimate of fight outcomes."""
+
+    def test_estimates_are_consistent(self):
+        """Test every sample ends with one side eliminated."""
+        wins, attackers, defenders = simulate_fights(10, 3, 500)
+        self.assertTrue(0 <= wins <= 500)
+        self.assertTrue(0.0 <= attackers <= 10.0)
+        self.assertTrue(0.0 <= defenders <= 3.0)
+
+    def test_no_defenders_always_wins(self):
+        """Test a fight against no defenders is always won untouched."""
+        self.assertEqual(simulate_fights(4, 0, 10), (10, 4.0, 0.0))
+
+    def test_batch_is_reproducible(self):
+        """Test a seeded batch split across workers repeats its estimate."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            random.seed(7)
+            first = simulate_fight_batch(6, 4, 200, 2, executor)
+            random.seed(7)
+            second = simulate_fight_batch(6, 4, 200, 2, executor)
+
+        self.assertEqual(first, second)
+        self.assertTrue(0 <= first[0] <= 200)
+
+    def test_batch_merges_worker_shares(self):
+        """Test the batch splits the samples and weights each worker."""
+        random.seed(7)
+        seeds = [random.getrandbits(64) for _ in range(3)]
+        results = [
+            simulate_fights(6, 4, share, random.Random(seed))
+            for share, seed in zip((67, 67, 66), seeds)
+        ]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            random.seed(7)
+            wins, attackers, defenders = simulate_fight_batch(
+                6, 4, 200, 3, executor
+            )
+
+        self.assertEqual(wins, sum(result[0] for result in results))
+        self.assertAlmostEqual(
+            attackers,
+            sum(r[1] * s for r, s in zip(results, (67, 67, 66))) / 200,
+        )
+        self.assertAlmostEqual(
+            defenders,
+            sum(r[2] * s for r, s in zip(results, (67, 67, 66))) / 200,
+        )
+
+
 class TestFight(unittest.TestCase):
     """Test Fight class mechanics and progression."""
     
@@ -152,12 +230,12 @@ class TestFight(unittest.TestCase):
         survivors = self.fight.get_surviving_armies()
         self.assertEqual(survivors, (3, 2))
     
-    @patch('random.randint')
+    @patch('random.randrange')
     def test_fight_round_mechanics(self, mock_random):
         """Test single round of combat with mocked dice."""
-        # Mock dice rolls: Need enough values for both attacker and defender
+        # Mock dice rolls: both sides are rolled in a single draw
         # Attacker with 4 armies gets 3 dice, defender with 2 armies gets 2 dice
-        mock_random.side_effect = [6, 5, 4, 3, 2]  # Extra values just in case
+        mock_random.return_value = roll_index([6, 5, 4, 3, 2])
         
         # Set up specific army counts to get predictable dice counts
         self.fight.current_attackers = 4  # Gets 3 dice
@@ -168,6 +246,8 @@ class TestFight(unittest.TestCase):
         # Verify dice roll results
         self.assertEqual(len(dice_roll.attacker_dice), 3)
         self.assertEqual(len(dice_roll.defender_dice), 2)
+        self.assertEqual(dice_roll.attacker_dice, (6, 5, 4))
+        self.assertEqual(dice_roll.defender_dice, (3, 2))
         
         # Verify fight state updates
         self.assertEqual(self.fight.rounds_fought, 1)
@@ -180,20 +260,19 @@ class TestFight(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.fight.fight_round()
     
-    @patch('random.randint')
+    @patch('random.randrange')
     def test_fight_to_completion(self, mock_random):
         """Test complete fight execution."""
         # Set up mock to create a predictable fight outcome
         # Use high values for attackers, low for defenders to ensure attacker wins
-        mock_values = []
-        # Generate enough values for a complete fight (estimate ~10 rounds max)
-        for i in range(50):
-            if i % 6 < 3:  # Attacker dice (high values)
-                mock_values.append(6)
-            else:  # Defender dice (low values)
-                mock_values.append(1)
-        
-        mock_random.side_effect = mock_values
+        def roll(stop):
+            k = 1
+            while 6 ** k < stop:
+                k += 1
+            faces = [6] * (k - 2) + [1, 1] if k > 3 else [6] * (k - 1) + [1]
+            return roll_index(faces)
+
+        mock_random.side_effect = roll
         
         result = self.fight.fight_to_completion()
         
@@ -202,6 +281,74 @@ class TestFight(unittest.TestCase):
         self.assertGreater(self.fight.rounds_fought, 0)
         # Don't assert specific result since it depends on random dice
     
+    def test_fight_without_history(self):
+        """Test rounds are not kept when history recording is off."""
+        fight = Fight(
+            attacker_territory_id=1,
+            defender_territory_id=2,
+            initial_attackers=5,
+            initial_defenders=3,
+            record_history=False,
+        )
+
+        fight.fight_to_completion()
+
+        self.assertIsNone(fight.dice_history)
+        self.assertGreater(fight.rounds_fought, 0)
+        self.assertIn("dice not recorded", fight.get_battle_summary())
+
+    def test_fight_n_rounds(self):
+        """Test a bounded fight stops after the given number of rounds."""
+        self.fight.current_attackers = 50
+        self.fight.current_defenders = 50
+
+        result = self.fight.fight_n_rounds(3)
+
+        self.assertEqual(result, FightResult.ONGOING)
+        self.assertEqual(self.fight.rounds_fought, 3)
+        self.assertEqual(len(self.fight.dice_history), 3)
+
+    def test_fight_to_completion_analytic(self):
+        """Test the analytic odds against hand worked small fights."""
+        self.fight.current_attackers = 2
+        self.fight.current_defenders = 1
+        win, attackers, defenders = self.fight.fight_to_completion_analytic()
+
+        # one die each, and the attacker may lose once before failing
+        self.assertAlmostEqual(win, 1 - (21 / 36) ** 2)
+        self.assertAlmostEqual(attackers, 2 * 15 / 36 + 21 / 36 * 15 / 36)
+        self.assertAlmostEqual(defenders, 1 - win)
+        self.assertEqual(self.fight.rounds_fought, 0)
+
+    def test_fight_to_completion_fast(self):
+        """Test the fast path completes and keeps counts consistent."""
+        fight = Fight(
+            attacker_territory_id=1,
+            defender_territory_id=2,
+            initial_attackers=5,
+            initial_defenders=3,
+            record_history=False,
+        )
+        result = fight.fight_to_completion_fast()
+
+        self.assertTrue(fight.is_completed())
+        self.assertNotEqual(result, FightResult.ONGOING)
+        self.assertGreater(fight.rounds_fought, 0)
+        self.assertIsNone(fight.dice_history)
+
+        survivors_att, survivors_def = fight.get_surviving_armies()
+        casualties_att, casualties_def = fight.get_casualties()
+        self.assertEqual(survivors_att + casualties_att, 5)
+        self.assertEqual(survivors_def + casualties_def, 3)
+        self.assertTrue(survivors_att == 0 or survivors_def == 0)
+
+    def test_fight_to_completion_fast_when_recording(self):
+        """Test the fast path refuses a fight that records its dice."""
+        with self.assertRaises(ValueError):
+            self.fight.fight_to_completion_fast()
+
+        self.assertEqual(self.fight.rounds_fought, 0)
+
     def test_battle_summary_generation(self):
         """Test battle summary string generation."""
         self.fight.rounds_fought = 3
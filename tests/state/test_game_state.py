@@ -1,6 +1,7 @@
 import unittest
 
-from risk.state import GameState
+from risk.state import Fight, GameState, Player
+from risk.state.event_stack.events.sideffects import CasualitiesOnTerritory
 import random
 
 
@@ -71,3 +72,307 @@ class TestAdvanceTurn(unittest.TestCase):
             self.state.current_turn,
             turn
         )
+
+
+class TestDeferredStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(5, 5, 10)
+        self.state.initialise()
+
+    def test_refresh_when_dirty(self):
+        player = self.state.get_player(0)
+        for territory in player.territories_controlled:
+            self.state.get_territory(territory).set_owner(None)
+
+        self.state.mark_statistics_dirty()
+        active = self.state.get_active_players()
+
+        self.assertNotIn(player, active)
+        self.assertFalse(player.is_active)
+        self.assertEqual(player.get_territory_count(), 0)
+
+    def test_no_refresh_when_clean(self):
+        player = self.state.get_player(0)
+        count = player.get_territory_count()
+        for territory in player.territories_controlled:
+            self.state.get_territory(territory).set_owner(None)
+
+        self.state.refresh_player_statistics()
+
+        self.assertEqual(player.get_territory_count(), count)
+
+    def test_active_players_follow_direct_deactivation(self):
+        self.assertEqual(len(self.state.get_active_players()), 5)
+        for player_id in (1, 2, 3, 4):
+            self.state.get_player(player_id).is_active = False
+
+        self.assertEqual(
+            self.state.get_active_players(), [self.state.get_player(0)]
+        )
+        self.assertEqual(self.state.check_victory_condition(), 0)
+
+    def test_active_players_follow_lost_territories(self):
+        player = self.state.get_player(0)
+        for territory in player.territories_controlled:
+            self.state.get_territory(territory).set_owner(None)
+        self.state.mark_statistics_dirty()
+
+        self.assertNotIn(player, self.state.get_active_players())
+
+    def test_statistics_follow_side_effects(self):
+        player = self.state.get_player(0)
+        armies = player.total_armies
+        territory = self.state.get_territories_owned_by(0)[0]
+        territory.add_armies(2)
+
+        CasualitiesOnTerritory(territory.id, 1).apply(self.state)
+        self.state.refresh_player_statistics()
+
+        self.assertEqual(player.total_armies, armies + 1)
+        self.assertEqual(
+            self.state.map.get_node(territory.id).value, territory.armies
+        )
+
+
+class TestTerritoriesMask(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(5, 5, 10)
+        self.state.initialise()
+
+    def test_mask_matches_ownership(self):
+        for player in self.state.players.values():
+            owned = {
+                territory.id
+                for territory in self.state.get_territories_owned_by(player.id)
+            }
+            self.assertEqual(player.territories_controlled, owned)
+            self.assertEqual(player.get_territory_count(), len(owned))
+
+    def test_add_and_remove(self):
+        player = self.state.get_player(0)
+        player.territories_controlled = {1, 3}
+        player.add_territory(4)
+        player.remove_territory(1)
+
+        self.assertEqual(player.territories_controlled, {3, 4})
+        self.assertEqual(player.territories_mask, 0b11000)
+
+    def test_controlled_set_seeds_mask(self):
+        player = Player(
+            id=7, name="P7", color=(0, 0, 0), territories_controlled={1, 2}
+        )
+
+        self.assertEqual(player.territories_mask, 0b110)
+        self.assertEqual(eval(repr(player)), player)
+        with self.assertRaises(AttributeError):
+            player.territories_controlled.add(3)
+
+    def test_reinforcements_follow_territory_count(self):
+        player = self.state.get_player(0)
+        player.territories_controlled = {0, 1}
+        self.assertEqual(self.state.calculate_reinforcements(0), 3)
+
+        player.territories_controlled = set(range(12))
+        self.assertEqual(self.state.calculate_reinforcements(0), 4)
+
+    def test_victory_by_controlling_every_territory(self):
+        for territory in self.state.territories.values():
+            territory.set_owner(2, 1)
+        self.state.mark_statistics_dirty()
+
+        self.assertEqual(self.state.check_victory_condition(), 2)
+
+    def test_victory_after_owners_change_directly(self):
+        self.assertIsNone(self.state.check_victory_condition())
+
+        for player in self.state.players.values():
+            player.territories_controlled = set()
+        self.state.get_player(2).territories_controlled = set(
+            self.state.territories
+        )
+
+        self.assertEqual(self.state.check_victory_condition(), 2)
+
+
+class TestOwnerIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(5, 2, 10)
+        self.state.initialise()
+
+    def test_follows_set_owner(self):
+        territory = self.state.get_territories_owned_by(0)[0]
+        territory.set_owner(1, 2)
+
+        self.assertNotIn(territory, self.state.get_territories_owned_by(0))
+        self.assertIn(territory, self.state.get_territories_owned_by(1))
+
+        territory.set_owner(None)
+        self.assertEqual(self.state.get_free_territories(), [territory])
+
+    def test_follows_resolve_contest(self):
+        territory = self.state.get_territories_owned_by(0)[0]
+        territory.set_contested()
+        self.assertIn(territory, self.state.get_territories_owned_by(0))
+
+        territory.resolve_contest(1, 3)
+        self.assertNotIn(territory, self.state.get_territories_owned_by(0))
+        self.assertIn(territory, self.state.get_territories_owned_by(1))
+        self.assertIn(territory, self.state.get_attacking_territories(1))
+
+    def test_copied_territory_leaves_index(self):
+        from copy import deepcopy
+
+        territory = self.state.get_territories_owned_by(0)[0]
+        copied = deepcopy(territory)
+        copied.set_owner(1, 2)
+
+        self.assertIsNone(copied._game_state)
+        self.assertIn(territory, self.state.get_territories_owned_by(0))
+        self.assertNotIn(copied, self.state.get_territories_owned_by(1))
+
+    def test_matches_scan(self):
+        for player_id in self.state.players:
+            self.assertEqual(
+                self.state.get_territories_owned_by(player_id),
+                [
+                    territory
+                    for territory in self.state.territories.values()
+                    if territory.is_owned_by(player_id)
+                ],
+            )
+
+    def test_attacking_territories_match_scan(self):
+        weakened = self.state.get_territories_owned_by(0)[0]
+        weakened.armies = 1
+        for player_id in self.state.players:
+            self.assertEqual(
+                self.state.get_attacking_territories(player_id),
+                [
+                    territory
+                    for territory in self.state.territories.values()
+                    if territory.is_owned_by(player_id)
+                    and territory.can_attack_from()
+                ],
+            )
+        self.assertNotIn(weakened, self.state.get_attacking_territories(0))
+
+
+class TestSeededStart(unittest.TestCase):
+
+    def _starting_player(self, seed):
+        state = GameState.create_new_game(5, 4, 10)
+        state.seed = seed
+        state.current_player_id = None
+        state.initialise()
+        return state.starting_player
+
+    def test_same_seed_same_start(self):
+        for seed in range(5):
+            self.assertEqual(
+                self._starting_player(seed), self._starting_player(seed)
+            )
+
+    def _seeded_game(self, seed):
+        state = GameState.create_new_game(5, 2, 10)
+        state.seed = seed
+        state.initialise()
+        return state
+
+    def test_same_seed_same_board(self):
+        first, second = self._seeded_game(3), self._seeded_game(3)
+
+        for territory_id, territory in first.territories.items():
+            other = second.get_territory(territory_id)
+            self.assertEqual(territory.vertices, other.vertices)
+            self.assertEqual(territory.owner, other.owner)
+            self.assertEqual(territory.armies, other.armies)
+
+    def test_same_seed_same_fights(self):
+        results = []
+        for state in (self._seeded_game(3), self._seeded_game(3)):
+            fights = [
+                Fight(0, 1, attackers, 4, rng=state.get_rng())
+                for attackers in range(2, 8)
+            ]
+            for fight in fights:
+                fight.fight_to_completion()
+            results.append(
+                [(fight.get_result(), fight.dice_history) for fight in fights]
+            )
+
+        self.assertEqual(results[0], results[1])
+
+    def test_unseeded_game_owns_generator(self):
+        first = GameState.create_new_game(5, 2, 10)
+        second = GameState.create_new_game(5, 2, 10)
+
+        self.assertIsInstance(first.get_rng(), random.Random)
+        self.assertIsNot(first.get_rng(), random._inst)
+        self.assertIsNot(first.get_rng(), second.get_rng())
+
+
+class TestCopyGameState(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(10, 3, 20)
+        self.state.initialise()
+
+    def test_copy_is_independent(self):
+        from risk.utils.copy import copy_game_state
+
+        copy = copy_game_state(self.state)
+        for terr_id, territory in self.state.territories.items():
+            copied = copy.get_territory(terr_id)
+            self.assertIsNot(copied, territory)
+            self.assertEqual(copied.owner, territory.owner)
+            self.assertEqual(copied.armies, territory.armies)
+            self.assertIs(copied._game_state(), copy)
+
+        territory = copy.get_territories_owned_by(0)[0]
+        territory.set_owner(1, 5)
+        self.assertEqual(self.state.get_territory(territory.id).owner, 0)
+        self.assertIn(territory.id, copy._by_owner[1])
+        self.assertNotIn(territory.id, self.state._by_owner[1])
+
+    def test_copy_carries_on_generator(self):
+        from risk.utils.copy import copy_game_state
+
+        state = GameState.create_new_game(10, 3, 20)
+        state.seed = 11
+        state.initialise()
+        rng = state.get_rng()
+        for _ in range(50):
+            rng.random()
+
+        first = copy_game_state(state)
+        second = copy_game_state(state)
+        self.assertIsNot(first.get_rng(), rng)
+
+        expected = rng.random()
+        self.assertEqual(first.get_rng().random(), expected)
+        self.assertEqual(second.get_rng().random(), expected)
+
+
+class TestAdjacency(unittest.TestCase):
+
+    def setUp(self):
+        self.state = GameState.create_new_game(10, 2, 10)
+        self.state.initialise()
+
+    def test_is_adjacent_to_matches_sets(self):
+        for territory in self.state.territories.values():
+            adjacent = {t.id for t in territory.adjacent_territories}
+            for other in self.state.territories:
+                self.assertEqual(territory.is_adjacent_to(other), other in adjacent)
+
+    def test_add_and_remove(self):
+        first = self.state.get_territory(0)
+        last = self.state.get_territory(9)
+        first.remove_adjacent_territory(last)
+        self.assertFalse(first.is_adjacent_to(9))
+
+        first.add_adjacent_territory(last)
+        self.assertTrue(first.is_adjacent_to(9))
@@ -328,5 +328,31 @@ class TestTurnManager(unittest.TestCase):
         self.assertFalse(result)
 
 
+
+class TestLegalAttacks(unittest.TestCase):
+    """Test attack enumeration on a generated board."""
+
+    def setUp(self):
+        """Set up a small game with its own turn manager."""
+        with patch("builtins.print"):
+            self.game_state = GameState.create_new_game(10, 3, 20)
+            self.game_state.initialise()
+        self.turn_manager = TurnManager(self.game_state)
+
+    def test_legal_attacks_match_pairwise_check(self):
+        """Test every enumerated attack passes the start_attack rules."""
+        territories = self.game_state.territories.values()
+        for player_id in self.game_state.players:
+            expected = [
+                (attacker.id, defender.id)
+                for attacker in territories
+                for defender in territories
+                if attacker.owner == player_id
+                and attacker.armies > 1
+                and defender.owner != player_id
+                and attacker.is_adjacent_to(defender.id)
+            ]
+            self.assertEqual(self.turn_manager.legal_attacks(player_id), expected)
+
 if __name__ == "__main__":
     unittest.main()